@@ -12,8 +12,13 @@ Lyrics segments (``type == "lyrics"``) are scored separately in a
 
 from __future__ import annotations
 
+import bisect
 import difflib
+import functools
+import heapq
+import re
 import statistics
+from dataclasses import dataclass
 from typing import Any
 
 # CJK ranges duplicated from preprocess.py for self-contained script detection.
@@ -29,11 +34,23 @@ _CJK_RANGES = (
     (0x20000, 0x2A6DF),  # CJK Unified Ideographs Extension B
 )
 
+# One character class covering every range above, so script counting runs
+# inside the regex engine instead of a per-character Python loop.
+_CJK_RUN_RE = re.compile(
+    "[" + "".join(f"\\U{lo:08x}-\\U{hi:08x}" for lo, hi in _CJK_RANGES) + "]+"
+)
+_WHITESPACE_RE = re.compile(r"\s+")
+
 try:
     import jiwer
 except ImportError:
     jiwer = None  # type: ignore[assignment]
 
+try:
+    from rapidfuzz import fuzz
+except ImportError:
+    fuzz = None  # type: ignore[assignment]
+
 
 # ---------------------------------------------------------------------------
 # Public API
@@ -61,14 +78,41 @@ def evaluate_asr(
         ``lyrics_bonus`` — text metrics for lyrics segments (or ``None``).
     """
     # Separate dialogue and lyrics
-    gen_dialogue = [s for s in generated if s.get("type") != "lyrics"]
-    ref_dialogue = [s for s in reference if s.get("type") != "lyrics"]
-    gen_lyrics = [s for s in generated if s.get("type") == "lyrics"]
-    ref_lyrics = [s for s in reference if s.get("type") == "lyrics"]
+    gen_dialogue, gen_lyrics = split_by_type(generated)
+    ref_dialogue, ref_lyrics = split_by_type(reference)
 
     # Align dialogue segments
     dialogue_pairs = align_segments(gen_dialogue, ref_dialogue)
 
+    # Align lyrics (if any)
+    lyrics_pairs: list[tuple[dict, dict]] | None = None
+    if gen_lyrics and ref_lyrics:
+        lyrics_pairs = align_segments(gen_lyrics, ref_lyrics)
+
+    return evaluate_asr_prealigned(dialogue_pairs, lyrics_pairs)
+
+
+def evaluate_asr_prealigned(
+    dialogue_pairs: list[tuple[dict, dict]],
+    lyrics_pairs: list[tuple[dict, dict]] | None = None,
+) -> dict[str, Any]:
+    """Evaluate ASR quality from segment pairs that are already aligned.
+
+    Use this when the caller has run :func:`align_segments` itself (as
+    ``compare.py`` does) so the alignment is not computed a second time.
+
+    Parameters
+    ----------
+    dialogue_pairs : list[tuple[dict, dict]]
+        Aligned ``(generated, reference)`` dialogue segments.
+    lyrics_pairs : list[tuple[dict, dict]] | None
+        Aligned lyrics segments, or ``None`` when either side has no lyrics.
+
+    Returns
+    -------
+    dict
+        Same shape as :func:`evaluate_asr`.
+    """
     # Text metrics — corpus-level
     text_metrics = _compute_text_metrics(dialogue_pairs)
 
@@ -77,8 +121,7 @@ def evaluate_asr(
 
     # Lyrics bonus (if any)
     lyrics_bonus: dict[str, Any] | None = None
-    if gen_lyrics and ref_lyrics:
-        lyrics_pairs = align_segments(gen_lyrics, ref_lyrics)
+    if lyrics_pairs:
         lyrics_bonus = _compute_text_metrics(lyrics_pairs)
 
     return {
@@ -88,6 +131,30 @@ def evaluate_asr(
     }
 
 
+# ---------------------------------------------------------------------------
+# Partitioning
+# ---------------------------------------------------------------------------
+
+
+def split_by_type(segments: list[dict]) -> tuple[list[dict], list[dict]]:
+    """Partition *segments* into ``(dialogue, lyrics)`` in a single pass.
+
+    A segment is lyrics when ``type == "lyrics"``; everything else
+    (including segments without a ``type``) counts as dialogue.  Input
+    order is preserved within each list.
+    """
+    dialogue: list[dict] = []
+    lyrics: list[dict] = []
+    add_dialogue = dialogue.append
+    add_lyrics = lyrics.append
+    for seg in segments:
+        if seg.get("type") == "lyrics":
+            add_lyrics(seg)
+        else:
+            add_dialogue(seg)
+    return dialogue, lyrics
+
+
 # ---------------------------------------------------------------------------
 # Segment alignment
 # ---------------------------------------------------------------------------
@@ -114,37 +181,133 @@ def align_segments(
     if not generated or not reference:
         return []
 
-    # Pre-compute all scores
-    scores: list[tuple[float, int, int]] = []
-    for gi, gseg in enumerate(generated):
-        for ri, rseg in enumerate(reference):
-            ts = text_similarity(gseg.get("source", ""), rseg.get("source", ""))
-            to = temporal_overlap(gseg, rseg)
-            combined = 0.6 * ts + 0.4 * to
-            scores.append((combined, gi, ri))
-
-    # Sort descending by combined score
-    scores.sort(key=lambda x: x[0], reverse=True)
+    # Read every segment dict once into parallel columns; the hot loops
+    # below only touch plain lists.
+    gen_cols = _to_columns(generated)
+    ref_cols = _to_columns(reference)
+    gen_texts = gen_cols.texts
+    ref_texts = ref_cols.texts
+    ref_lengths = [len(text) for text in ref_texts]
+
+    # Temporal IoU is only non-zero for overlapping intervals; find those
+    # with a sorted sweep instead of evaluating every pair.
+    overlaps = _overlap_candidates(gen_cols, ref_cols)
+
+    # Seed a max-heap (negated scores) with a cheap *upper bound* for every
+    # pair: the length ratio caps any similarity score.  The exact
+    # text_similarity is only computed when a pair reaches the top of the
+    # heap; it is then re-pushed with its exact score.  Because bounds never
+    # under-estimate, exact entries pop in the same order a full sort of
+    # exact scores would give, ties included (by (gi, ri)).
+    heap: list[tuple[float, int, int, bool]] = []
+    for gi, gtext in enumerate(gen_texts):
+        glen = len(gtext)
+        row = overlaps[gi]
+        for ri, rlen in enumerate(ref_lengths):
+            bound = _similarity_upper_bound(glen, rlen)
+            to = row.get(ri, 0.0)
+            heap.append((-(0.6 * bound + 0.4 * to), gi, ri, False))
+    heapq.heapify(heap)
 
     paired: list[tuple[dict, dict]] = []
-    used_gen: set[int] = set()
-    used_ref: set[int] = set()
-
-    for score, gi, ri in scores:
-        if gi in used_gen or ri in used_ref:
+    # Flat flag arrays indexed by segment position: O(1) membership
+    # without hashing, and no per-insert allocation as with a set.
+    used_gen = bytearray(len(generated))
+    used_ref = bytearray(len(reference))
+    target = min(len(generated), len(reference))
+
+    # Pop best-first until one side is exhausted; the remaining
+    # (lower-scoring) entries are never ordered.
+    while heap and len(paired) < target:
+        _neg_score, gi, ri, exact = heapq.heappop(heap)
+        if used_gen[gi] or used_ref[ri]:
+            continue
+        if not exact:
+            ts = text_similarity(gen_texts[gi], ref_texts[ri])
+            to = overlaps[gi].get(ri, 0.0)
+            heapq.heappush(heap, (-(0.6 * ts + 0.4 * to), gi, ri, True))
             continue
         paired.append((generated[gi], reference[ri]))
-        used_gen.add(gi)
-        used_ref.add(ri)
+        used_gen[gi] = 1
+        used_ref[ri] = 1
 
     return paired
 
 
+@dataclass
+class _SegmentColumns:
+    """Struct-of-arrays view of the fields alignment reads from segments."""
+
+    starts: list[float]
+    ends: list[float]
+    texts: list[str]
+
+
+def _to_columns(segments: list[dict]) -> _SegmentColumns:
+    """Extract ``start``/``end``/``source`` into parallel lists in one pass."""
+    starts: list[float] = []
+    ends: list[float] = []
+    texts: list[str] = []
+    for seg in segments:
+        starts.append(seg["start"])
+        ends.append(seg["end"])
+        texts.append(seg.get("source", ""))
+    return _SegmentColumns(starts, ends, texts)
+
+
+def _overlap_candidates(
+    generated: _SegmentColumns,
+    reference: _SegmentColumns,
+) -> list[dict[int, float]]:
+    """Return, per generated segment, ``{reference_index: IoU}`` for overlaps.
+
+    Reference segments are sorted by start time once.  For each generated
+    segment only references starting inside
+    ``[start - longest_reference_duration, end)`` can overlap it, so that
+    window is located with two ``bisect`` calls and the remaining pairs
+    (IoU == 0) are never visited.
+    """
+    order = sorted(range(len(reference.starts)), key=reference.starts.__getitem__)
+    starts = [reference.starts[ri] for ri in order]
+    ends = [reference.ends[ri] for ri in order]
+    max_duration = max(
+        (end - start for start, end in zip(starts, ends)), default=0.0
+    )
+    max_duration = max(0.0, max_duration)
+
+    candidates: list[dict[int, float]] = []
+    for g_start, g_end in zip(generated.starts, generated.ends):
+        lo = bisect.bisect_left(starts, g_start - max_duration)
+        hi = bisect.bisect_left(starts, g_end)
+        row: dict[int, float] = {}
+        for k in range(lo, hi):
+            iou = _interval_iou(g_start, g_end, starts[k], ends[k])
+            if iou > 0.0:
+                row[order[k]] = iou
+        candidates.append(row)
+
+    return candidates
+
+
 # ---------------------------------------------------------------------------
 # Similarity helpers
 # ---------------------------------------------------------------------------
 
 
+def _similarity_upper_bound(len_a: int, len_b: int) -> float:
+    """Upper bound on :func:`text_similarity` from string lengths alone.
+
+    Both backends score ``2 * matches / (len_a + len_b)`` with
+    ``matches <= min(len_a, len_b)`` (this is ``SequenceMatcher``'s
+    ``real_quick_ratio``).  A tiny slack absorbs float rounding in the
+    backends so the bound is never below the exact score.
+    """
+    total = len_a + len_b
+    if total == 0:
+        return 0.0
+    return min(1.0, 2.0 * min(len_a, len_b) / total + 1e-9)
+
+
 def temporal_overlap(seg_a: dict, seg_b: dict) -> float:
     """Compute Intersection-over-Union (IoU) of two time intervals.
 
@@ -158,9 +321,15 @@ def temporal_overlap(seg_a: dict, seg_b: dict) -> float:
     float
         IoU in [0, 1].
     """
-    a_start, a_end = seg_a["start"], seg_a["end"]
-    b_start, b_end = seg_b["start"], seg_b["end"]
+    return _interval_iou(seg_a["start"], seg_a["end"], seg_b["start"], seg_b["end"])
+
 
+def _interval_iou(a_start: float, a_end: float, b_start: float, b_end: float) -> float:
+    """IoU of ``[a_start, a_end]`` and ``[b_start, b_end]`` on raw floats.
+
+    Shared by :func:`temporal_overlap` and the alignment sweep so the hot
+    loop works on pre-extracted columns instead of segment dicts.
+    """
     inter_start = max(a_start, b_start)
     inter_end = min(a_end, b_end)
     intersection = max(0.0, inter_end - inter_start)
@@ -172,13 +341,25 @@ def temporal_overlap(seg_a: dict, seg_b: dict) -> float:
     return intersection / union
 
 
+@functools.lru_cache(maxsize=1 << 16)
 def text_similarity(text_a: str, text_b: str) -> float:
-    """Compute text similarity in [0, 1] using ``difflib.SequenceMatcher``.
+    """Compute text similarity in [0, 1].
+
+    Uses RapidFuzz's C++ ``fuzz.ratio`` (normalised Indel similarity) when
+    ``rapidfuzz`` is installed, otherwise ``difflib.SequenceMatcher``.  The
+    two agree on identical and disjoint strings; RapidFuzz may score
+    partially matching strings slightly higher.
+
+    Results are memoised because repeated lines (OP/ED, recurring phrases)
+    produce identical text pairs.  Arguments are not reordered because
+    ``SequenceMatcher`` is not strictly symmetric.
 
     Returns 0.0 if both strings are empty.
     """
     if not text_a and not text_b:
         return 0.0
+    if fuzz is not None:
+        return fuzz.ratio(text_a, text_b) / 100.0
     return difflib.SequenceMatcher(None, text_a, text_b).ratio()
 
 
@@ -215,23 +396,43 @@ def compute_cer(hypothesis: str, reference: str) -> float:
     return float(jiwer.cer(reference, hypothesis))
 
 
+def compute_wer_cer(hypothesis: str, reference: str) -> tuple[float, float]:
+    """Compute Word and Character Error Rate together.
+
+    Uses ``jiwer.process_words`` / ``jiwer.process_characters`` so each
+    alignment is built once; callers that need both rates avoid going
+    through jiwer's end-to-end ``wer``/``cer`` wrappers twice.
+
+    Requires the ``jiwer`` package.  Raises ``RuntimeError`` if not installed.
+
+    Returns
+    -------
+    tuple[float, float]
+        ``(wer, cer)``.
+    """
+    if jiwer is None:
+        raise RuntimeError(
+            "jiwer is required for WER/CER computation. Install it with: pip install jiwer"
+        )
+    if not reference.strip():
+        rate = 0.0 if not hypothesis.strip() else 1.0
+        return rate, rate
+    words = jiwer.process_words(reference, hypothesis)
+    chars = jiwer.process_characters(reference, hypothesis)
+    return float(words.wer), float(chars.cer)
+
+
 def detect_metric_type(text: str) -> str:
     """Decide whether to use ``"wer"`` or ``"cer"`` based on script detection.
 
     CJK-dominated text uses CER (character-level); Latin text uses WER
     (word-level).
     """
-    cjk_count = 0
-    total = 0
-    for ch in text:
-        if ch.isspace():
-            continue
-        total += 1
-        cp = ord(ch)
-        for lo, hi in _CJK_RANGES:
-            if lo <= cp <= hi:
-                cjk_count += 1
-                break
+    # ``\s`` matches exactly the characters ``str.isspace`` accepts
+    # (including U+3000, which sits inside a CJK range).
+    visible = _WHITESPACE_RE.sub("", text)
+    total = len(visible)
+    cjk_count = sum(map(len, _CJK_RUN_RE.findall(visible)))
 
     if total == 0:
         return "wer"
@@ -273,17 +474,22 @@ def compute_timestamp_metrics(pairs: list[tuple[dict, dict]]) -> dict[str, float
     end_offsets: list[float] = []
     ious: list[float] = []
 
+    # One walk over the pairs; each segment's times are read exactly once.
     for gen, ref in pairs:
-        start_offsets.append(abs(gen["start"] - ref["start"]))
-        end_offsets.append(abs(gen["end"] - ref["end"]))
-        ious.append(temporal_overlap(gen, ref))
-
+        g_start, g_end = gen["start"], gen["end"]
+        r_start, r_end = ref["start"], ref["end"]
+        start_offsets.append(abs(g_start - r_start))
+        end_offsets.append(abs(g_end - r_end))
+        ious.append(_interval_iou(g_start, g_end, r_start, r_end))
+
+    # fmean works on floats directly; statistics.mean converts every value
+    # to an exact fraction first, which dominates on long files.
     return {
-        "mean_start_offset": statistics.mean(start_offsets),
+        "mean_start_offset": statistics.fmean(start_offsets),
         "median_start_offset": statistics.median(start_offsets),
-        "mean_end_offset": statistics.mean(end_offsets),
+        "mean_end_offset": statistics.fmean(end_offsets),
         "median_end_offset": statistics.median(end_offsets),
-        "mean_iou": statistics.mean(ious),
+        "mean_iou": statistics.fmean(ious),
     }
 
 
@@ -301,9 +507,17 @@ def _compute_text_metrics(pairs: list[tuple[dict, dict]]) -> dict[str, Any]:
     if not pairs:
         return {"metric_type": "wer", "score": None, "num_segments": 0}
 
+    # Collect both sides in one walk; ``str.join`` on a list sizes the
+    # result up front instead of growing it from a generator.
+    hyp_texts: list[str] = []
+    ref_texts: list[str] = []
+    for gen, ref in pairs:
+        hyp_texts.append(gen.get("source", ""))
+        ref_texts.append(ref.get("source", ""))
+
     # Concatenate all texts for corpus-level computation
-    all_hyp = " ".join(gen.get("source", "") for gen, _ref in pairs)
-    all_ref = " ".join(ref.get("source", "") for _gen, ref in pairs)
+    all_hyp = " ".join(hyp_texts)
+    all_ref = " ".join(ref_texts)
 
     metric_type = detect_metric_type(all_ref)
 
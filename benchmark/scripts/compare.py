@@ -19,8 +19,15 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
 from benchmark.scripts.preprocess import preprocess
-from benchmark.scripts.asr_eval import align_segments, evaluate_asr
-from benchmark.scripts.translation_eval import evaluate_translation
+from benchmark.scripts.asr_eval import (
+    align_segments,
+    evaluate_asr_prealigned,
+    split_by_type,
+)
+from benchmark.scripts.translation_eval import (
+    _MAX_CONCURRENCY as _DEFAULT_JUDGE_WORKERS,
+    evaluate_translation,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -36,6 +43,7 @@ def main(
     no_translation: bool = False,
     source_lang: str | None = None,
     target_lang: str | None = None,
+    judge_workers: int | None = None,
 ) -> dict:
     """Compare two subtitle files and return an evaluation report dict.
 
@@ -51,6 +59,9 @@ def main(
         Skip translation evaluation when ``True``.
     source_lang, target_lang : str | None
         Override automatic language detection.
+    judge_workers : int | None
+        Maximum concurrent LLM judge calls during translation evaluation
+        (default: the translation evaluator's own limit).
 
     Returns
     -------
@@ -76,17 +87,18 @@ def main(
         print("WARNING: No segments found in reference file.")
 
     # 2. Separate dialogue from lyrics
-    gen_dialogue = [s for s in gen_segments if s.get("type") != "lyrics"]
-    ref_dialogue = [s for s in ref_segments if s.get("type") != "lyrics"]
-    gen_lyrics = [s for s in gen_segments if s.get("type") == "lyrics"]
-    ref_lyrics = [s for s in ref_segments if s.get("type") == "lyrics"]
+    gen_dialogue, gen_lyrics = split_by_type(gen_segments)
+    ref_dialogue, ref_lyrics = split_by_type(ref_segments)
 
-    # 3. Align dialogue segments
+    # 3. Align dialogue (and lyrics) segments once; both the ASR and the
+    #    translation evaluation reuse these pairs.
     aligned_pairs = align_segments(gen_dialogue, ref_dialogue)
+    lyrics_pairs = (
+        align_segments(gen_lyrics, ref_lyrics) if gen_lyrics and ref_lyrics else None
+    )
 
-    # 4. ASR evaluation (full segments — evaluate_asr handles dialogue/lyrics
-    #    separation internally)
-    asr_scores = evaluate_asr(gen_segments, ref_segments)
+    # 4. ASR evaluation
+    asr_scores = evaluate_asr_prealigned(aligned_pairs, lyrics_pairs)
 
     # 5. Translation evaluation (unless skipped)
     translation_scores: dict | None = None
@@ -97,6 +109,7 @@ def main(
             aligned_pairs,
             source_lang=trans_source,
             target_lang=trans_target,
+            max_workers=judge_workers,
         )
 
     # 6. Build report
@@ -120,7 +133,8 @@ def main(
     if output_path:
         out = Path(output_path)
         out.parent.mkdir(parents=True, exist_ok=True)
-        out.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+        with out.open("w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2, ensure_ascii=False)
         print(f"Report written to {out}")
 
     # 8. Print summary
@@ -248,6 +262,12 @@ def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         default=None,
         help="Override target language detection (e.g. zh, en, ja)",
     )
+    parser.add_argument(
+        "--judge-workers",
+        type=int,
+        default=None,
+        help=f"Maximum concurrent LLM judge calls (default: {_DEFAULT_JUDGE_WORKERS})",
+    )
     return parser.parse_args(argv)
 
 
@@ -261,6 +281,7 @@ if __name__ == "__main__":
             no_translation=args.no_translation,
             source_lang=args.source_lang,
             target_lang=args.target_lang,
+            judge_workers=args.judge_workers,
         )
     except FileNotFoundError as exc:
         print(f"ERROR: {exc}", file=sys.stderr)
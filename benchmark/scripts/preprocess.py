@@ -12,7 +12,13 @@ Output format per segment::
 
 from __future__ import annotations
 
+import functools
+import os
 import re
+import sys
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 
@@ -48,20 +54,20 @@ def preprocess(path: str | Path, source_lang: str = "auto") -> list[dict]:
         raise ValueError(f"Unsupported subtitle format: {suffix}")
 
     # Detect main / lyrics styles (ASS only – SRT has no style info)
-    main_style = _detect_main_style(raw) if suffix == ".ass" else None
-    lyrics_styles = _detect_lyrics_styles(raw) if suffix == ".ass" else set()
+    if suffix == ".ass":
+        main_style, lyrics_styles = _detect_styles(raw)
+    else:
+        main_style, lyrics_styles = None, set()
 
     # Filter noise
     filtered = _filter_noise(raw, main_style, lyrics_styles)
 
-    # Assign type, strip tags, split bilingual
+    # Assign type, split bilingual (tags were stripped by _filter_noise)
     segments: list[dict] = []
     for seg in filtered:
-        text = _strip_ass_tags(seg["text"])
-        if not text.strip():
-            continue
+        text = seg["text_clean"]
 
-        style = seg.get("style", "Default")
+        style = seg["style"]
 
         # Determine segment type
         if style in lyrics_styles:
@@ -89,6 +95,44 @@ def preprocess(path: str | Path, source_lang: str = "auto") -> list[dict]:
     return segments
 
 
+def preprocess_many(
+    paths: Iterable[str | Path],
+    source_lang: str = "auto",
+    *,
+    workers: int | None = None,
+) -> list[list[dict]]:
+    """Run :func:`preprocess` over several subtitle files.
+
+    Files are independent, so with ``workers`` > 1 they are parsed in
+    parallel worker processes.  With one worker, or a single file, they are
+    parsed sequentially in this process.
+
+    Parameters
+    ----------
+    paths : Iterable[str | Path]
+        Subtitle files (.ass or .srt).
+    source_lang : str
+        Forwarded to :func:`preprocess` for every file.
+    workers : int | None
+        Number of worker processes; ``None`` uses ``os.cpu_count()``.
+
+    Returns
+    -------
+    list[list[dict]]
+        One segment list per file, in the order given.
+    """
+    paths = list(paths)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(paths))
+
+    if workers <= 1:
+        return [preprocess(p, source_lang) for p in paths]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(preprocess, paths, [source_lang] * len(paths)))
+
+
 # ---------------------------------------------------------------------------
 # ASS parser
 # ---------------------------------------------------------------------------
@@ -100,81 +144,84 @@ def _parse_ass(path: Path) -> list[dict]:
     then splits each ``Dialogue:`` line by ``,`` with the correct maxsplit
     (since the Text field may contain commas).
     """
-    content = path.read_text(encoding="utf-8-sig")
-    lines = content.splitlines()
-
     field_order: list[str] = []
+    start_idx = end_idx = text_idx = style_idx = None
     segments: list[dict] = []
     in_events = False
 
-    for line in lines:
-        stripped = line.strip()
-
-        # Section headers
-        if stripped.startswith("[") and stripped.endswith("]"):
-            in_events = stripped.lower() == "[events]"
-            continue
-
-        if not in_events:
-            continue
-
-        # Format line
-        if stripped.lower().startswith("format:"):
-            raw_fields = stripped.split(":", 1)[1]
-            field_order = [f.strip().lower() for f in raw_fields.split(",")]
-            continue
-
-        # Dialogue / Comment lines
-        if ":" not in stripped:
-            continue
-
-        line_type_str, _, rest = stripped.partition(":")
-        line_type_str = line_type_str.strip().lower()
-
-        if line_type_str not in ("dialogue", "comment"):
-            continue
-
-        if not field_order:
-            continue
-
-        # Split with maxsplit = len(field_order) - 1
-        # so the last field (Text) keeps its commas
-        parts = rest.split(",", maxsplit=len(field_order) - 1)
-        if len(parts) < len(field_order):
-            continue
-
-        fields = {}
-        for i, name in enumerate(field_order):
-            fields[name] = parts[i].strip()
-
-        start = _parse_ass_timestamp(fields.get("start", "0:00:00.00"))
-        end = _parse_ass_timestamp(fields.get("end", "0:00:00.00"))
-        text = fields.get("text", "")
-        style = fields.get("style", "Default")
-
-        segments.append({
-            "start": start,
-            "end": end,
-            "text": text,
-            "style": style,
-            "line_type": line_type_str,
-        })
+    # Iterate the file handle so the whole file is never held as one string
+    # plus a list of its lines.
+    with path.open(encoding="utf-8-sig") as fh:
+        for line in fh:
+            stripped = line.strip()
+
+            # Section headers
+            if stripped.startswith("[") and stripped.endswith("]"):
+                in_events = stripped.lower() == "[events]"
+                continue
+
+            if not in_events:
+                continue
+
+            # Format line
+            if stripped.lower().startswith("format:"):
+                raw_fields = stripped.split(":", 1)[1]
+                field_order = [f.strip().lower() for f in raw_fields.split(",")]
+                # Resolve the columns we read once; a repeated name keeps
+                # its last position.
+                columns = {name: i for i, name in enumerate(field_order)}
+                start_idx = columns.get("start")
+                end_idx = columns.get("end")
+                text_idx = columns.get("text")
+                style_idx = columns.get("style")
+                continue
+
+            # Dialogue / Comment lines
+            if ":" not in stripped:
+                continue
+
+            line_type_str, _, rest = stripped.partition(":")
+            line_type_str = line_type_str.strip().lower()
+
+            if line_type_str not in ("dialogue", "comment"):
+                continue
+
+            if not field_order:
+                continue
+
+            # Split with maxsplit = len(field_order) - 1
+            # so the last field (Text) keeps its commas
+            parts = rest.split(",", maxsplit=len(field_order) - 1)
+            if len(parts) < len(field_order):
+                continue
+
+            start = _parse_ass_timestamp(parts[start_idx]) if start_idx is not None else 0.0
+            end = _parse_ass_timestamp(parts[end_idx]) if end_idx is not None else 0.0
+            text = parts[text_idx].strip() if text_idx is not None else ""
+            # A file uses a handful of styles across thousands of lines;
+            # interning shares one string per name and makes the repeated
+            # style comparisons downstream identity hits.
+            style = sys.intern(parts[style_idx].strip()) if style_idx is not None else "Default"
+
+            segments.append({
+                "start": start,
+                "end": end,
+                "text": text,
+                "style": style,
+                "line_type": sys.intern(line_type_str),
+            })
 
     return segments
 
 
 def _parse_ass_timestamp(ts: str) -> float:
     """Convert ASS timestamp ``H:MM:SS.cc`` to seconds."""
-    ts = ts.strip()
-    parts = ts.split(":")
-    if len(parts) != 3:
-        return 0.0
+    # int()/float() ignore surrounding whitespace, and unpacking raises
+    # ValueError unless there are exactly three fields.
     try:
-        h = int(parts[0])
-        m = int(parts[1])
-        s = float(parts[2])
-        return h * 3600 + m * 60 + s
-    except (ValueError, IndexError):
+        h, m, s = ts.split(":")
+        return int(h) * 3600 + int(m) * 60 + float(s)
+    except ValueError:
         return 0.0
 
 
@@ -189,54 +236,51 @@ _SRT_TS_RE = re.compile(
 )
 
 
+def _iter_srt_blocks(lines: Iterable[str]) -> Iterator[str]:
+    """Yield the text of each blank-line-separated block in *lines*."""
+    block: list[str] = []
+    for line in lines:
+        if line == "\n":
+            if block:
+                yield "".join(block)
+                block = []
+        else:
+            block.append(line)
+    if block:
+        yield "".join(block)
+
+
 def _parse_srt(path: Path) -> list[dict]:
     """Parse an SRT file into raw segment dicts."""
-    content = path.read_text(encoding="utf-8-sig")
-    blocks = re.split(r"\n\n+", content.strip())
-
     segments: list[dict] = []
-    for block in blocks:
-        lines = block.strip().splitlines()
-        if not lines:
-            continue
-
-        # Find the timestamp line
-        ts_line_idx = None
-        for i, ln in enumerate(lines):
-            if _SRT_TS_RE.search(ln):
-                ts_line_idx = i
-                break
-
-        if ts_line_idx is None:
-            continue
-
-        m = _SRT_TS_RE.search(lines[ts_line_idx])
-        if not m:
-            continue
-
-        start = (
-            int(m.group(1)) * 3600
-            + int(m.group(2)) * 60
-            + int(m.group(3))
-            + int(m.group(4)) / 1000
-        )
-        end = (
-            int(m.group(5)) * 3600
-            + int(m.group(6)) * 60
-            + int(m.group(7))
-            + int(m.group(8)) / 1000
-        )
-
-        text_lines = lines[ts_line_idx + 1:]
-        text = "\n".join(text_lines)
-
-        segments.append({
-            "start": start,
-            "end": end,
-            "text": text,
-            "style": "Default",
-            "line_type": "dialogue",
-        })
+    with path.open(encoding="utf-8-sig") as fh:
+        for block in _iter_srt_blocks(fh):
+            lines = block.strip().splitlines()
+            if not lines:
+                continue
+
+            # Find the timestamp line, keeping its match
+            for ts_line_idx, ln in enumerate(lines):
+                m = _SRT_TS_RE.search(ln)
+                if m:
+                    break
+            else:
+                continue
+
+            h1, m1, s1, ms1, h2, m2, s2, ms2 = m.groups()
+            start = int(h1) * 3600 + int(m1) * 60 + int(s1) + int(ms1) / 1000
+            end = int(h2) * 3600 + int(m2) * 60 + int(s2) + int(ms2) / 1000
+
+            text_lines = lines[ts_line_idx + 1:]
+            text = "\n".join(text_lines)
+
+            segments.append({
+                "start": start,
+                "end": end,
+                "text": text,
+                "style": "Default",
+                "line_type": "dialogue",
+            })
 
     return segments
 
@@ -252,21 +296,32 @@ def _filter_noise(
 ) -> list[dict]:
     """Remove noisy segments that should not be evaluated.
 
+    *segments* are raw dicts from the parsers, which always set ``start``,
+    ``end``, ``text``, ``style`` and ``line_type``.
+
     Noise criteria:
     - Comment lines (line_type == "comment")
     - Vector drawings (``\\p1`` tag)
     - Duration > 600 s (watermarks / static signs)
     - Pure-tag lines (only ``{...}`` blocks, no visible text)
     - Credits at boundaries (first/last 5 s of the file with short text)
+
+    Kept segments get a ``text_clean`` key holding the tag-stripped text so
+    callers don't have to strip the tags a second time.
     """
     if not segments:
         return []
 
-    # Determine file boundaries for credits detection
-    all_starts = [s["start"] for s in segments]
-    all_ends = [s["end"] for s in segments]
-    file_start = min(all_starts)
-    file_end = max(all_ends)
+    # Determine file boundaries for credits detection (one pass, no lists)
+    file_start = segments[0]["start"]
+    file_end = segments[0]["end"]
+    for seg in segments:
+        start = seg["start"]
+        end = seg["end"]
+        if start < file_start:
+            file_start = start
+        if end > file_end:
+            file_end = end
 
     keep_styles = set()
     if main_style:
@@ -276,10 +331,10 @@ def _filter_noise(
     result: list[dict] = []
     for seg in segments:
         # Skip comments
-        if seg.get("line_type") == "comment":
+        if seg["line_type"] == "comment":
             continue
 
-        text = seg.get("text", "")
+        text = seg["text"]
 
         # Skip vector drawings
         if r"\p1" in text or r"\p2" in text:
@@ -290,6 +345,11 @@ def _filter_noise(
         if duration > 600:
             continue
 
+        # If we know the main style, filter out non-main, non-lyrics styles
+        # (e.g. signs, title cards)
+        if keep_styles and seg["style"] not in keep_styles:
+            continue
+
         # Skip pure-tag lines (only {...} blocks, no visible text)
         stripped_text = _strip_ass_tags(text).strip()
         if not stripped_text:
@@ -299,16 +359,18 @@ def _filter_noise(
         if _is_credits(seg, stripped_text, file_start, file_end):
             continue
 
-        # If we know the main style, filter out non-main, non-lyrics styles
-        # (e.g. signs, title cards)
-        if keep_styles and seg.get("style") not in keep_styles:
-            continue
-
+        seg["text_clean"] = stripped_text
         result.append(seg)
 
     return result
 
 
+_CREDIT_RE = re.compile(
+    r"(?i)(translat|timer|typeset|encod|edit|qc|kfx|karaoke|"
+    r"subtitle[sd]?\s*by|字幕|翻译|校对|时间轴|压制|特效)"
+)
+
+
 def _is_credits(
     seg: dict, text: str, file_start: float, file_end: float
 ) -> bool:
@@ -317,15 +379,10 @@ def _is_credits(
     Heuristic: within 5 s of file boundaries, text ≤ 30 chars, and matches
     common credit patterns (Translator, Timer, Encoder, etc.).
     """
-    CREDIT_RE = re.compile(
-        r"(?i)(translat|timer|typeset|encod|edit|qc|kfx|karaoke|"
-        r"subtitle[sd]?\s*by|字幕|翻译|校对|时间轴|压制|特效)"
-    )
-
     at_start = seg["start"] < file_start + 5
     at_end = seg["end"] > file_end - 5
 
-    if (at_start or at_end) and len(text) <= 50 and CREDIT_RE.search(text):
+    if (at_start or at_end) and len(text) <= 50 and _CREDIT_RE.search(text):
         return True
     return False
 
@@ -334,50 +391,51 @@ def _is_credits(
 # Style detection
 # ---------------------------------------------------------------------------
 
-def _detect_main_style(segments: list[dict]) -> str | None:
-    """Return the most frequently used style (= main dialogue style).
+_LYRICS_KEYWORDS = re.compile(
+    r"(?i)(^op$|^ed$|^op\d|^ed\d|opening|ending|"
+    r"lyric|song|insert|歌词|歌|片头|片尾|"
+    r"romaji|roma(?:ji)?$|ruby|karaoke|kfx)",
+)
 
-    Only considers non-comment Dialogue lines.  Styles whose names match
-    lyrics keywords are excluded so that OP/ED styles don't compete with
-    the actual dialogue style.
-    """
-    # First pass: identify lyrics-style names to exclude
-    lyrics = _detect_lyrics_styles(segments)
 
-    style_counts: dict[str, int] = {}
+def _detect_styles(segments: list[dict]) -> tuple[str | None, set[str]]:
+    """Return ``(main_style, lyrics_styles)`` from a single pass.
+
+    Lyrics styles are those whose names match lyrics keywords; each
+    distinct style name is tested once.  The main style is the most
+    frequent style among non-comment lines, excluding lyrics styles so that
+    OP/ED styles don't compete with the actual dialogue style.
+    """
+    lyrics: set[str] = set()
+    seen: set[str] = set()
+    style_counts: Counter[str] = Counter()
     for seg in segments:
-        if seg.get("line_type") == "comment":
-            continue
-        style = seg.get("style", "Default")
-        if style in lyrics:
+        style = seg["style"]
+        if style not in seen:
+            seen.add(style)
+            if _LYRICS_KEYWORDS.search(style):
+                lyrics.add(style)
+        if style in lyrics or seg["line_type"] == "comment":
             continue
-        style_counts[style] = style_counts.get(style, 0) + 1
+        style_counts[style] += 1
 
-    if not style_counts:
-        return None
+    main_style = style_counts.most_common(1)[0][0] if style_counts else None
+    return main_style, lyrics
 
-    return max(style_counts, key=style_counts.get)  # type: ignore[arg-type]
 
+def _detect_main_style(segments: list[dict]) -> str | None:
+    """Return the most frequently used style (= main dialogue style).
 
-_LYRICS_KEYWORDS = re.compile(
-    r"(?i)(^op$|^ed$|^op\d|^ed\d|opening|ending|"
-    r"lyric|song|insert|歌词|歌|片头|片尾|"
-    r"romaji|roma(?:ji)?$|ruby|karaoke|kfx)",
-)
+    Only considers non-comment Dialogue lines.  Styles whose names match
+    lyrics keywords are excluded so that OP/ED styles don't compete with
+    the actual dialogue style.
+    """
+    return _detect_styles(segments)[0]
 
 
 def _detect_lyrics_styles(segments: list[dict]) -> set[str]:
     """Return styles whose names match lyrics-related keywords."""
-    styles: set[str] = set()
-    seen: set[str] = set()
-    for seg in segments:
-        style = seg.get("style", "Default")
-        if style in seen:
-            continue
-        seen.add(style)
-        if _LYRICS_KEYWORDS.search(style):
-            styles.add(style)
-    return styles
+    return _detect_styles(segments)[1]
 
 
 # ---------------------------------------------------------------------------
@@ -389,6 +447,9 @@ _ASS_TAG_RE = re.compile(r"\{[^}]*\}")
 
 def _strip_ass_tags(text: str) -> str:
     """Remove ASS override tag blocks ``{...}`` from *text*."""
+    # Most lines carry no tags at all; skip the regex call for them
+    if "{" not in text:
+        return text
     return _ASS_TAG_RE.sub("", text)
 
 
@@ -396,6 +457,8 @@ def _strip_ass_tags(text: str) -> str:
 # Bilingual splitting
 # ---------------------------------------------------------------------------
 
+# Lyric refrains repeat verbatim many times per episode.
+@functools.lru_cache(maxsize=2048)
 def _split_bilingual(text: str, source_lang: str) -> tuple[str, str]:
     r"""Split a potentially bilingual line on ``\N`` separator.
 
@@ -422,42 +485,24 @@ def _split_bilingual(text: str, source_lang: str) -> tuple[str, str]:
     # Normalise source_lang to "cjk" or "latin"
     source_script = _lang_to_script(source_lang)
 
-    # Check for \N separator (literal backslash-N in ASS)
-    if r"\N" in text:
-        parts = text.split(r"\N")
-        # Take the first two meaningful parts
-        parts = [p.strip() for p in parts if p.strip()]
-        if len(parts) >= 2:
-            script_a = _classify_script(parts[0])
-            script_b = _classify_script(parts[1])
-
-            # If scripts differ → bilingual
-            if script_a != script_b:
-                if _lang_to_script(script_a) == source_script:
-                    return parts[0], parts[1]
-                else:
-                    return parts[1], parts[0]
-
-            # Same script or can't distinguish — first is source
-            return parts[0], parts[1]
-
-        if len(parts) == 1:
-            return parts[0], ""
-
-    # Also check for literal newlines (SRT bilingual)
-    if "\n" in text:
-        parts = text.split("\n")
-        parts = [p.strip() for p in parts if p.strip()]
+    # Try the ASS ``\N`` separator first, then literal newlines (SRT
+    # bilingual).  A separator that leaves no visible part falls through.
+    for sep in (r"\N", "\n"):
+        if sep not in text:
+            continue
+        parts = [p for p in map(str.strip, text.split(sep)) if p]
         if len(parts) >= 2:
+            # Take the first two meaningful parts.  If the first already
+            # matches the source script it is the source whatever the
+            # second is, so the second only needs classifying otherwise.
             script_a = _classify_script(parts[0])
-            script_b = _classify_script(parts[1])
-
-            if script_a != script_b:
-                if _lang_to_script(script_a) == source_script:
-                    return parts[0], parts[1]
-                else:
-                    return parts[1], parts[0]
+            if script_a == source_script:
+                return parts[0], parts[1]
 
+            # Scripts differ → bilingual with the source second; same
+            # script or can't distinguish → first is source
+            if _classify_script(parts[1]) != script_a:
+                return parts[1], parts[0]
             return parts[0], parts[1]
 
         if len(parts) == 1:
@@ -466,6 +511,7 @@ def _split_bilingual(text: str, source_lang: str) -> tuple[str, str]:
     return text.strip(), ""
 
 
+@functools.lru_cache(maxsize=32)
 def _lang_to_script(lang: str) -> str:
     """Map a language code or script label to ``"cjk"`` or ``"latin"``."""
     lang = lang.lower().strip()
@@ -491,25 +537,33 @@ _CJK_RANGES = (
     (0x20000, 0x2A6DF),  # CJK Unified Ideographs Extension B
 )
 
+# _CJK_RANGES as a single regex character class: _classify_script counts
+# CJK runs with findall rather than testing each character in Python.
+_CJK_RUN_RE = re.compile(
+    "[" + "".join(f"\\U{lo:08x}-\\U{hi:08x}" for lo, hi in _CJK_RANGES) + "]+"
+)
+_WHITESPACE_RE = re.compile(r"\s+")
 
+
+# Bilingual files repeat short lines (OP/ED refrains, signs), so results
+# are memoised.
+@functools.lru_cache(maxsize=4096)
 def _classify_script(text: str) -> str:
     """Classify text as ``"cjk"`` or ``"latin"`` by Unicode block counting.
 
     Returns ``"cjk"`` if more than 30 % of non-whitespace, non-punctuation
     characters fall in CJK Unicode ranges; otherwise ``"latin"``.
     """
-    cjk_count = 0
-    total = 0
+    # No CJK range lies in ASCII, so the answer is already fixed; isascii()
+    # is a constant-time flag check on CPython strings.
+    if text.isascii():
+        return "latin"
 
-    for ch in text:
-        if ch.isspace():
-            continue
-        cp = ord(ch)
-        total += 1
-        for lo, hi in _CJK_RANGES:
-            if lo <= cp <= hi:
-                cjk_count += 1
-                break
+    # Drop whitespace first (``\s`` == ``str.isspace``) so the ideographic
+    # space U+3000 is not counted as CJK.
+    visible = _WHITESPACE_RE.sub("", text)
+    total = len(visible)
+    cjk_count = sum(map(len, _CJK_RUN_RE.findall(visible)))
 
     if total == 0:
         return "latin"
@@ -5,14 +5,17 @@ Usage::
 
     python3 benchmark/scripts/run.py benchmark/corpus/sample-001/
     python3 benchmark/scripts/run.py benchmark/corpus/sample-001/ --whisper-provider cpp --no-translation
+    python3 benchmark/scripts/run.py benchmark/corpus/sample-*/ --parallel 4
 """
 
 from __future__ import annotations
 
 import argparse
 import json
+import os
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Ensure repo root is on sys.path so ``benchmark.*`` imports work when
@@ -81,18 +84,20 @@ def _run_subgen(
     target_lang: str = "zh",
     whisper_provider: str | None = None,
     force_transcribe: bool = False,
+    isolated: bool = False,
 ) -> None:
-    """Run SubGen via subprocess to generate subtitles for *video_path*.
+    """Run SubGen to generate subtitles for *video_path*.
 
-    The generated ASS file is written to *output_path*.
+    The generated ASS file is written to *output_path*.  SubGen runs
+    in-process by default so that imports and the loaded Whisper model are
+    reused across samples; pass ``isolated=True`` to run it in a fresh
+    subprocess instead.
     """
     subgen_script = _REPO_ROOT / "subgen.py"
     if not subgen_script.exists():
         raise FileNotFoundError(f"SubGen entry point not found at {subgen_script}")
 
-    cmd: list[str] = [
-        sys.executable,
-        str(subgen_script),
+    args: list[str] = [
         "run",
         str(video_path),
         "--from", source_lang,
@@ -102,26 +107,62 @@ def _run_subgen(
     ]
 
     if whisper_provider:
-        cmd.extend(["--whisper-provider", whisper_provider])
+        args.extend(["--whisper-provider", whisper_provider])
 
     if force_transcribe:
-        cmd.append("--force-transcribe")
+        args.append("--force-transcribe")
 
-    print(f"Running SubGen: {' '.join(cmd)}")
-    print()
+    if isolated:
+        cmd = [sys.executable, str(subgen_script), *args]
+        print(f"Running SubGen: {' '.join(cmd)}")
+        print()
 
-    result = subprocess.run(
-        cmd,
-        cwd=str(_REPO_ROOT),
-        capture_output=False,
-    )
+        result = subprocess.run(
+            cmd,
+            cwd=str(_REPO_ROOT),
+            capture_output=False,
+        )
+        returncode = result.returncode
+    else:
+        print(f"Running SubGen (in-process): subgen {' '.join(args)}")
+        print()
+        returncode = _run_subgen_in_process(args)
 
-    if result.returncode != 0:
+    if returncode != 0:
         raise RuntimeError(
-            f"SubGen exited with code {result.returncode}"
+            f"SubGen exited with code {returncode}"
         )
 
 
+def _run_subgen_in_process(args: list[str]) -> int:
+    """Invoke the SubGen CLI in this interpreter and return its exit code.
+
+    Runs from the repo root, like the subprocess path, so relative paths in
+    the SubGen config resolve the same way.  Changing directory affects the
+    whole process, so this must not be called from several threads at once;
+    :func:`main_many` parallelises with processes, not threads.
+    """
+    import click
+    from subgen import cli as subgen_cli
+
+    prev_cwd = os.getcwd()
+    os.chdir(_REPO_ROOT)
+    try:
+        rv = subgen_cli.main(args=args, prog_name="subgen", standalone_mode=False)
+    except click.ClickException as exc:
+        exc.show()
+        return exc.exit_code
+    except click.Abort:
+        return 1
+    except SystemExit as exc:
+        if exc.code is None:
+            return 0
+        return exc.code if isinstance(exc.code, int) else 1
+    finally:
+        os.chdir(prev_cwd)
+    return rv if isinstance(rv, int) else 0
+
+
 # ---------------------------------------------------------------------------
 # Main pipeline
 # ---------------------------------------------------------------------------
@@ -135,6 +176,7 @@ def main(
     whisper_provider: str | None = None,
     no_translation: bool = False,
     force_transcribe: bool = False,
+    isolated: bool = False,
 ) -> dict:
     """Run the full benchmark pipeline on a sample directory.
 
@@ -153,6 +195,8 @@ def main(
         Skip translation evaluation.
     force_transcribe : bool
         Force re-transcription even if cache exists.
+    isolated : bool
+        Run SubGen in a subprocess instead of in-process.
 
     Returns
     -------
@@ -193,6 +237,7 @@ def main(
             target_lang=target_lang,
             whisper_provider=whisper_provider,
             force_transcribe=force_transcribe,
+            isolated=isolated,
         )
 
     # 4. Verify the generated file exists
@@ -221,6 +266,45 @@ def main(
     return report
 
 
+def main_many(
+    sample_dirs: list[str],
+    *,
+    workers: int | None = None,
+    **kwargs,
+) -> list[dict]:
+    """Run :func:`main` over several sample directories.
+
+    Samples are independent (each writes to its own results directory), so
+    with ``workers`` > 1 they run in parallel worker processes.  With one
+    worker, or a single sample, they run sequentially in this process, which
+    lets consecutive samples reuse the loaded Whisper model.
+
+    Parameters
+    ----------
+    sample_dirs : list[str]
+        Corpus sample directories.
+    workers : int | None
+        Number of worker processes; ``None`` uses ``os.cpu_count()``.
+    **kwargs
+        Forwarded to :func:`main` for every sample.
+
+    Returns
+    -------
+    list[dict]
+        One evaluation report per sample, in the order given.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(sample_dirs))
+
+    if workers <= 1:
+        return [main(d, **kwargs) for d in sample_dirs]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(main, d, **kwargs) for d in sample_dirs]
+        return [f.result() for f in futures]
+
+
 # ---------------------------------------------------------------------------
 # CLI entry point
 # ---------------------------------------------------------------------------
@@ -231,8 +315,9 @@ def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         description="Full benchmark pipeline: run SubGen on a video and compare against reference.",
     )
     parser.add_argument(
-        "sample_dir",
-        help="Path to the corpus sample directory",
+        "sample_dirs",
+        nargs="+",
+        help="Path(s) to corpus sample directories",
     )
     parser.add_argument(
         "--from", "-f",
@@ -263,19 +348,34 @@ def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         default=False,
         help="Force re-transcription even if cache exists",
     )
+    parser.add_argument(
+        "--isolated",
+        action="store_true",
+        default=False,
+        help="Run SubGen in a separate process instead of in-process",
+    )
+    parser.add_argument(
+        "--parallel", "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Evaluate up to N samples in parallel processes (default: 1)",
+    )
     return parser.parse_args(argv)
 
 
 if __name__ == "__main__":
     args = _parse_args()
     try:
-        main(
-            sample_dir=args.sample_dir,
+        main_many(
+            args.sample_dirs,
+            workers=args.parallel,
             source_lang=args.source_lang,
             target_lang=args.target_lang,
             whisper_provider=args.whisper_provider,
             no_translation=args.no_translation,
             force_transcribe=args.force_transcribe,
+            isolated=args.isolated,
         )
     except FileNotFoundError as exc:
         print(f"ERROR: {exc}", file=sys.stderr)
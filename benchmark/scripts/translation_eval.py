@@ -15,13 +15,33 @@ Only dialogue segments are evaluated (lyrics are excluded).
 
 If the copilot-api endpoint is unavailable the functions degrade gracefully
 and return ``None`` with a log message.
+
+Set ``SUBGEN_LLM_CACHE`` to a directory to cache judge replies on disk,
+keyed by model and prompt, so re-running a benchmark on unchanged subtitles
+skips the LLM round-trips.
+
+Judge requests are paced by a token bucket shared across worker threads,
+at ``SUBGEN_LLM_RPM`` requests per minute (default 500; ``0`` disables it),
+so a large evaluation stays under the copilot-api rate limit instead of
+running into 429 backoff.
 """
 
 from __future__ import annotations
 
+import atexit
+import functools
+import hashlib
 import json
 import logging
+import os
+import random
 import re
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
 try:
@@ -29,11 +49,34 @@ try:
 except ImportError:
     httpx = None  # type: ignore[assignment]
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 # Copilot-API settings
 _API_URL = "http://localhost:4141/v1/messages"
 _MODEL = "claude-opus-4.6"
+# Maximum number of judge requests in flight at once
+_MAX_CONCURRENCY = 8
+# Size of the shared HTTP pool; more workers than this would only queue
+# on it (and could hit PoolTimeout), so evaluate_translation caps them here
+_MAX_CONNECTIONS = _MAX_CONCURRENCY * 2
+# Transient failures (timeouts, dropped connections, 429/5xx) are retried
+# with exponential backoff before a batch is given up on
+_MAX_ATTEMPTS = 4
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_RETRY_DELAY = 60.0
+# Directory for cached judge replies; caching is off when unset
+_CACHE_DIR = os.environ.get("SUBGEN_LLM_CACHE") or None
+# Requests per minute across all workers; 0 turns the limiter off
+_DEFAULT_RPM = 500.0
+
+# orjson decodes bytes directly and is several times faster than the stdlib
+# for small objects; both raise ValueError subclasses on malformed input.
+_json_loads = orjson.loads if orjson is not None else json.loads
 
 # CJK ranges for language detection (same as preprocess / asr_eval)
 _CJK_RANGES = (
@@ -54,6 +97,19 @@ _KATAKANA = (0x30A0, 0x30FF)
 _HANGUL_RANGES = ((0xAC00, 0xD7AF), (0x1100, 0x11FF))
 
 
+def _char_class(ranges) -> str:
+    """Render code-point ranges as a regex character class."""
+    return "[" + "".join(f"\\U{lo:08x}-\\U{hi:08x}" for lo, hi in ranges) + "]"
+
+
+# Compiled forms of the ranges above, so _detect_language scans text in the
+# regex engine rather than testing each character in Python
+_CJK_RUN_RE = re.compile(_char_class(_CJK_RANGES) + "+")
+_KANA_RE = re.compile(_char_class((_HIRAGANA, _KATAKANA)))
+_HANGUL_RE = re.compile(_char_class(_HANGUL_RANGES))
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -63,6 +119,8 @@ def evaluate_translation(
     aligned_pairs: list[tuple[dict, dict]],
     source_lang: str = "auto",
     target_lang: str = "auto",
+    *,
+    max_workers: int | None = None,
 ) -> dict[str, Any] | None:
     """Score translation quality using an LLM judge.
 
@@ -74,11 +132,16 @@ def evaluate_translation(
     source_lang, target_lang : str
         Language names (e.g. ``"Japanese"``, ``"English"``).  ``"auto"``
         triggers heuristic detection.
+    max_workers : int | None
+        Maximum number of judge calls in flight; ``None`` uses
+        ``_MAX_CONCURRENCY``.  ``1`` scores batches one at a time.  Values
+        above the HTTP pool size (``_MAX_CONNECTIONS``) are capped to it.
 
     Returns
     -------
     dict | None
-        Aggregated scores dict, or ``None`` if the LLM call fails.
+        Aggregated scores dict, or ``None`` if no batch could be scored.
+        Batches whose LLM call fails are skipped.
     """
     # Filter to dialogue only
     dialogue_pairs = [
@@ -90,16 +153,17 @@ def evaluate_translation(
         logger.warning("No dialogue pairs to evaluate.")
         return None
 
-    # Build triples: (source_text, reference_translation, generated_translation)
-    triples: list[tuple[str, str, str]] = []
-    for gen, ref in dialogue_pairs:
-        src = ref.get("source", "")
-        ref_trans = ref.get("translation", "")
-        gen_trans = gen.get("translation", "")
-        if src.strip() or ref_trans.strip() or gen_trans.strip():
-            triples.append((src, ref_trans, gen_trans))
+    # Build triples: (source_text, reference_translation, generated_translation).
+    # Identical triples (recurring titles, repeated lines) are judged once
+    # and weighted by how often they occur; blank ones are dropped by
+    # _batch_triples, which only has to look at each distinct triple once.
+    counts: Counter[tuple[str, str, str]] = Counter(
+        (ref.get("source", ""), ref.get("translation", ""), gen.get("translation", ""))
+        for gen, ref in dialogue_pairs
+    )
+    batches = _batch_triples(list(counts))
 
-    if not triples:
+    if not batches:
         logger.warning("All triples are empty — nothing to evaluate.")
         return None
 
@@ -109,24 +173,37 @@ def evaluate_translation(
     if target_lang == "auto":
         target_lang = _detect_language(dialogue_pairs, "translation")
 
-    # Batch and score
-    batches = _batch_triples(triples)
-    all_scores: list[dict[str, float]] = []
-
-    for batch in batches:
-        prompt = _build_prompt(batch, source_lang, target_lang)
-        response = _call_llm(prompt)
-        if response is None:
-            return None
-        parsed = _parse_response(response)
-        if parsed is not None:
-            all_scores.append(parsed)
-
-    if not all_scores:
+    # Batch and score.  Judge calls are I/O-bound, so batches are sent
+    # concurrently and each worker parses its own reply as soon as it
+    # arrives; a batch that cannot be scored is left out of the average.
+    prompts = [_build_prompt(batch, source_lang, target_lang) for batch in batches]
+    weights = [sum(counts[t] for t in batch) for batch in batches]
+
+    running = _RunningMean()
+    skipped = 0
+    if max_workers is None:
+        max_workers = _MAX_CONCURRENCY
+    elif max_workers > _MAX_CONNECTIONS:
+        logger.info(
+            "Capping judge workers at %d (HTTP pool size), %d requested",
+            _MAX_CONNECTIONS, max_workers,
+        )
+        max_workers = _MAX_CONNECTIONS
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(prompts)))) as pool:
+        for weight, scores in zip(weights, pool.map(_judge_batch, prompts)):
+            if scores is not None:
+                running.add(scores, weight)
+            else:
+                skipped += 1
+
+    if not running.n:
         logger.warning("No valid scores returned by LLM.")
         return None
+    if skipped:
+        logger.warning("%d of %d batches could not be scored and were skipped.",
+                       skipped, len(batches))
 
-    return _aggregate_scores(all_scores)
+    return _aggregate_scores(running)
 
 
 # ---------------------------------------------------------------------------
@@ -153,36 +230,42 @@ def _build_prompt(
     str
         The formatted prompt to send to the LLM judge.
     """
-    lines: list[str] = []
-    lines.append(
+    segments = "".join(
+        f"--- Segment {i} ---\n"
+        f"Source ({source_lang}): {src}\n"
+        f"Reference ({target_lang}): {ref_t}\n"
+        f"Generated ({target_lang}): {gen_t}\n\n"
+        for i, (src, ref_t, gen_t) in enumerate(triples, 1)
+    )
+    return _prompt_header(source_lang, target_lang) + segments + _PROMPT_TRAILER
+
+
+@functools.lru_cache(maxsize=16)
+def _prompt_header(source_lang: str, target_lang: str) -> str:
+    """Return the instructions that open every prompt for a language pair."""
+    return (
         "You are a professional translation quality evaluator. "
-        f"Evaluate the following {source_lang} → {target_lang} subtitle translations."
+        f"Evaluate the following {source_lang} → {target_lang} subtitle translations.\n"
+        "\n"
+        "For each set of translations below, compare the Generated translation "
+        "against the Reference translation and the original Source text.\n"
+        "\n"
     )
-    lines.append("")
-    lines.append("For each set of translations below, compare the Generated translation "
-                 "against the Reference translation and the original Source text.")
-    lines.append("")
-
-    for i, (src, ref_t, gen_t) in enumerate(triples, 1):
-        lines.append(f"--- Segment {i} ---")
-        lines.append(f"Source ({source_lang}): {src}")
-        lines.append(f"Reference ({target_lang}): {ref_t}")
-        lines.append(f"Generated ({target_lang}): {gen_t}")
-        lines.append("")
-
-    lines.append("Score the Generated translations on these four dimensions (1-10 scale):")
-    lines.append("- accuracy: semantic faithfulness to the source")
-    lines.append("- naturalness: fluency and readability in the target language")
-    lines.append("- terminology: correct handling of domain-specific terms")
-    lines.append("- cultural_adaptation: appropriate handling of cultural references and idioms")
-    lines.append("")
-    lines.append("Return your evaluation as a single JSON object with exactly these keys:")
-    lines.append('{"accuracy": <float>, "naturalness": <float>, '
-                 '"terminology": <float>, "cultural_adaptation": <float>}')
-    lines.append("")
-    lines.append("Return ONLY the JSON object, no other text.")
-
-    return "\n".join(lines)
+
+
+_PROMPT_TRAILER = (
+    "Score the Generated translations on these four dimensions (1-10 scale):\n"
+    "- accuracy: semantic faithfulness to the source\n"
+    "- naturalness: fluency and readability in the target language\n"
+    "- terminology: correct handling of domain-specific terms\n"
+    "- cultural_adaptation: appropriate handling of cultural references and idioms\n"
+    "\n"
+    "Return your evaluation as a single JSON object with exactly these keys:\n"
+    '{"accuracy": <float>, "naturalness": <float>, '
+    '"terminology": <float>, "cultural_adaptation": <float>}\n'
+    "\n"
+    "Return ONLY the JSON object, no other text."
+)
 
 
 # ---------------------------------------------------------------------------
@@ -190,9 +273,84 @@ def _build_prompt(
 # ---------------------------------------------------------------------------
 
 
+class _RateLimiter:
+    """Thread-safe token bucket allowing *rate* acquisitions per *period*.
+
+    Up to *rate* calls (at least one) may go through back to back; after
+    that callers block in :meth:`acquire` until the bucket refills.
+    """
+
+    def __init__(self, rate: float, period: float = 60.0) -> None:
+        # A bucket smaller than one token could never be drawn from
+        self.capacity = max(1.0, rate)
+        self.fill_rate = rate / period
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.fill_rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.fill_rate
+            time.sleep(wait)
+
+
+def _limiter_from_env() -> _RateLimiter | None:
+    """Build the shared limiter from ``SUBGEN_LLM_RPM``."""
+    raw = os.environ.get("SUBGEN_LLM_RPM")
+    try:
+        rpm = float(raw) if raw else _DEFAULT_RPM
+    except ValueError:
+        logger.warning("Ignoring invalid SUBGEN_LLM_RPM=%r", raw)
+        rpm = _DEFAULT_RPM
+    return _RateLimiter(rpm) if rpm > 0 else None
+
+
+_LIMITER = _limiter_from_env()
+
+_CLIENT: httpx.Client | None = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def _get_client() -> httpx.Client:
+    """Return the shared keep-alive client, creating it on first use.
+
+    Reusing one pooled client saves a TCP handshake and client construction
+    per judge call; it is thread-safe, so concurrent batches share it.
+    """
+    global _CLIENT
+    with _CLIENT_LOCK:
+        if _CLIENT is None:
+            _CLIENT = httpx.Client(
+                limits=httpx.Limits(
+                    max_keepalive_connections=_MAX_CONCURRENCY,
+                    max_connections=_MAX_CONNECTIONS,
+                    keepalive_expiry=30.0,
+                ),
+                # Fail fast when copilot-api isn't listening; replies
+                # themselves may take a while
+                timeout=httpx.Timeout(60.0, connect=5.0),
+            )
+            atexit.register(_CLIENT.close)
+        return _CLIENT
+
+
 def _call_llm(prompt: str) -> str | None:
     """Call Claude via the copilot-api local endpoint.
 
+    Every attempt first takes a token from the shared rate limiter.
+    Timeouts, connection errors and 429/5xx responses are retried up to
+    ``_MAX_ATTEMPTS`` times in total (see :func:`_retry_delay`).
+
     Returns the response text, or ``None`` if the call fails.
     """
     if httpx is None:
@@ -207,123 +365,308 @@ def _call_llm(prompt: str) -> str | None:
         ],
     }
 
-    try:
-        response = httpx.post(
-            _API_URL,
-            json=payload,
-            timeout=60.0,
-        )
-        response.raise_for_status()
-        data = response.json()
+    for attempt in range(_MAX_ATTEMPTS):
+        if _LIMITER is not None:
+            _LIMITER.acquire()
+        try:
+            response = _get_client().post(_API_URL, json=payload)
+            response.raise_for_status()
+            data = _json_loads(response.content)
+
+            # Extract text from Claude's response format
+            content = data.get("content", [])
+            if isinstance(content, list) and content:
+                return content[0].get("text", "")
+            return None
 
-        # Extract text from Claude's response format
-        content = data.get("content", [])
-        if isinstance(content, list) and content:
-            return content[0].get("text", "")
-        return None
+        except (httpx.HTTPError, httpx.TimeoutException, ConnectionError, OSError) as exc:
+            delay = _retry_delay(exc, attempt)
+            if delay is None or attempt == _MAX_ATTEMPTS - 1:
+                logger.warning("copilot-api call failed: %s", exc)
+                return None
+            logger.info("copilot-api call failed (%s); retrying in %.1fs", exc, delay)
+            time.sleep(delay)
+        except (KeyError, IndexError, json.JSONDecodeError) as exc:
+            logger.warning("Unexpected response format from copilot-api: %s", exc)
+            return None
+    return None
 
-    except (httpx.HTTPError, httpx.TimeoutException, ConnectionError, OSError) as exc:
-        logger.warning("copilot-api call failed: %s", exc)
-        return None
-    except (KeyError, IndexError, json.JSONDecodeError) as exc:
-        logger.warning("Unexpected response format from copilot-api: %s", exc)
+
+def _retry_delay(exc: BaseException, attempt: int) -> float | None:
+    """Return how long to wait before retrying after *exc*, or ``None``.
+
+    HTTP errors are retried only for statuses in ``_RETRY_STATUSES``, and a
+    numeric ``Retry-After`` header is honoured.  Errors without a response
+    (timeouts, connection resets) are always retried.  Otherwise the delay
+    is ``0.5 * 2**attempt`` seconds plus up to 0.25 s of jitter, capped at
+    ``_MAX_RETRY_DELAY``.
+    """
+    response = getattr(exc, "response", None)
+    status = getattr(response, "status_code", None)
+    if status is not None:
+        if status not in _RETRY_STATUSES:
+            return None
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return min(_MAX_RETRY_DELAY, max(0.0, float(retry_after)))
+            except ValueError:
+                pass  # HTTP-date form; fall back to backoff
+    return min(_MAX_RETRY_DELAY, 0.5 * 2**attempt) + random.random() * 0.25
+
+
+# Appended when re-asking after a reply that could not be parsed
+_JSON_ONLY_NUDGE = (
+    "\n\nIMPORTANT: reply with the JSON object only — no prose, no code fences."
+)
+
+
+def _judge_batch(prompt: str) -> dict[str, float] | None:
+    """Send one batch prompt and parse the judge's reply.
+
+    An unparseable reply is retried once with a JSON-only reminder.
+
+    Returns
+    -------
+    dict | None
+        The parsed scores, or ``None`` if the LLM call failed or no reply
+        could be parsed.
+    """
+    response = _cached_call_llm(prompt)
+    if response is None:
         return None
+    scores = _parse_response(response)
+    if scores is None:
+        response = _cached_call_llm(prompt + _JSON_ONLY_NUDGE)
+        if response is None:
+            return None
+        scores = _parse_response(response)
+    return scores
+
+
+def _cached_call_llm(prompt: str) -> str | None:
+    """:func:`_call_llm` behind the optional on-disk reply cache.
+
+    Entries live under ``_CACHE_DIR`` as one JSON file per SHA-256 of the
+    model name and prompt, so a model change never hits stale replies.
+    Only successful replies are stored.
+    """
+    if not _CACHE_DIR:
+        return _call_llm(prompt)
+
+    key = hashlib.sha256(f"{_MODEL}\0{prompt}".encode("utf-8")).hexdigest()
+    path = Path(_CACHE_DIR) / key[:2] / f"{key}.json"
+
+    try:
+        return _json_loads(path.read_bytes())["text"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    response = _call_llm(prompt)
+    if response is not None:
+        entry = {"text": response, "model": _MODEL, "ts": time.time()}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so concurrent readers never see a partial file
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+            tmp.replace(path)
+        except OSError as exc:
+            logger.warning("Could not write LLM cache entry %s: %s", path, exc)
+    return response
 
 
 # ---------------------------------------------------------------------------
 # Response parsing
 # ---------------------------------------------------------------------------
 
-_JSON_RE = re.compile(r"\{[^{}]*\}")
+# Decodes one JSON value from an offset and reports where it ended
+_JSON_DECODER = json.JSONDecoder()
+
+
+_REQUIRED_KEYS = frozenset({"accuracy", "naturalness", "terminology", "cultural_adaptation"})
 
 
 def _parse_response(text: str) -> dict[str, float] | None:
     """Extract score dict from LLM response text.
 
-    Tries to parse the whole text as JSON first.  Falls back to extracting
-    the first ``{...}`` block.
+    Tries to parse the whole text as JSON first, then the body of a
+    Markdown code fence (```` ```json ... ``` ````).  Falls back to the
+    first JSON object embedded in the text that holds the scores.
     """
-    required = {"accuracy", "naturalness", "terminology", "cultural_adaptation"}
+    stripped = text.strip()
 
     # Try direct parse
-    try:
-        data = json.loads(text.strip())
-        if isinstance(data, dict) and required.issubset(data.keys()):
-            return {k: float(data[k]) for k in required}
-    except (json.JSONDecodeError, ValueError, TypeError):
-        pass
-
-    # Fallback: regex extraction
-    match = _JSON_RE.search(text)
-    if match:
+    scores = _scores_from_json(stripped)
+    if scores is not None:
+        return scores
+
+    # Fenced reply: drop the opening ``` line and the closing fence
+    if stripped.startswith("```"):
+        body = stripped.partition("\n")[2].removesuffix("```")
+        scores = _scores_from_json(body)
+        if scores is not None:
+            return scores
+
+    # Fallback: decode from each "{" in turn.  The decoder tracks strings
+    # and nesting, so a brace inside a value doesn't cut the object short,
+    # and a non-score wrapper object is searched for a nested one.
+    start = text.find("{")
+    while start != -1:
         try:
-            data = json.loads(match.group())
-            if isinstance(data, dict) and required.issubset(data.keys()):
-                return {k: float(data[k]) for k in required}
-        except (json.JSONDecodeError, ValueError, TypeError):
+            data, _end = _JSON_DECODER.raw_decode(text, start)
+        except ValueError:
             pass
+        else:
+            scores = _scores_from_data(data)
+            if scores is not None:
+                return scores
+        start = text.find("{", start + 1)
 
     logger.warning("Could not parse LLM response as score JSON: %.200s", text)
     return None
 
 
+def _scores_from_json(raw: str) -> dict[str, float] | None:
+    """Decode *raw* as a JSON score object, or return ``None``."""
+    try:
+        data = _json_loads(raw)
+    except ValueError:
+        return None
+    return _scores_from_data(data)
+
+
+def _scores_from_data(data: Any) -> dict[str, float] | None:
+    """Return the four scores as floats if *data* is a score object."""
+    if isinstance(data, dict) and _REQUIRED_KEYS.issubset(data.keys()):
+        try:
+            return {k: float(data[k]) for k in _REQUIRED_KEYS}
+        except (ValueError, TypeError):
+            pass
+    return None
+
+
 # ---------------------------------------------------------------------------
 # Batching & aggregation
 # ---------------------------------------------------------------------------
 
 
+# Approximate characters _build_prompt adds around each triple (segment
+# header, Source/Reference/Generated labels with language names, newlines)
+_SEGMENT_OVERHEAD_CHARS = 120
+
+
 def _batch_triples(
     triples: list[tuple[str, str, str]],
-    batch_size: int = 20,
+    batch_size: int = 50,
+    max_prompt_chars: int = 12000,
 ) -> list[list[tuple[str, str, str]]]:
-    """Split *triples* into batches of at most *batch_size*.
+    """Pack *triples* into batches for the judge prompt.
+
+    A batch is closed when it holds *batch_size* triples or when the next
+    triple would push its estimated segment text past *max_prompt_chars*.
+    A single triple larger than the budget still gets a batch of its own.
 
     Empty triples (all three strings blank) are filtered out.
     """
-    # Filter empties
-    filtered = [
-        t for t in triples
-        if any(s.strip() for s in t)
-    ]
-    if not filtered:
-        return []
+    batches: list[list[tuple[str, str, str]]] = []
+    batch: list[tuple[str, str, str]] = []
+    batch_chars = 0
+
+    for t in triples:
+        # Filter empties
+        if not (t[0].strip() or t[1].strip() or t[2].strip()):
+            continue
+        size = len(t[0]) + len(t[1]) + len(t[2]) + _SEGMENT_OVERHEAD_CHARS
+        if batch and (len(batch) >= batch_size or batch_chars + size > max_prompt_chars):
+            batches.append(batch)
+            batch = []
+            batch_chars = 0
+        batch.append(t)
+        batch_chars += size
+
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+@dataclass
+class _RunningMean:
+    """Streaming per-dimension sums of batch scores.
+
+    Lets :func:`evaluate_translation` fold each batch in as it arrives
+    instead of keeping every score dict until the end.  ``n`` is the total
+    weight added so far.
+    """
 
-    return [filtered[i:i + batch_size] for i in range(0, len(filtered), batch_size)]
+    accuracy: float = 0.0
+    naturalness: float = 0.0
+    terminology: float = 0.0
+    cultural_adaptation: float = 0.0
+    n: int = 0
+
+    def add(self, scores: dict[str, float], weight: int = 1) -> None:
+        self.accuracy += scores["accuracy"] * weight
+        self.naturalness += scores["naturalness"] * weight
+        self.terminology += scores["terminology"] * weight
+        self.cultural_adaptation += scores["cultural_adaptation"] * weight
+        self.n += weight
+
+    def finalize(self) -> dict[str, float]:
+        """Return the averages and composite (all zeros when empty)."""
+        if not self.n:
+            return {
+                "accuracy": 0.0,
+                "naturalness": 0.0,
+                "terminology": 0.0,
+                "cultural_adaptation": 0.0,
+                "composite": 0.0,
+            }
+
+        n = self.n
+        avg: dict[str, float] = {
+            "accuracy": self.accuracy / n,
+            "naturalness": self.naturalness / n,
+            "terminology": self.terminology / n,
+            "cultural_adaptation": self.cultural_adaptation / n,
+        }
 
+        avg["composite"] = (
+            0.4 * avg["accuracy"]
+            + 0.3 * avg["naturalness"]
+            + 0.15 * avg["terminology"]
+            + 0.15 * avg["cultural_adaptation"]
+        )
 
-def _aggregate_scores(batch_scores: list[dict[str, float]]) -> dict[str, float]:
+        return avg
+
+
+def _aggregate_scores(
+    batch_scores: list[dict[str, float] | tuple[dict[str, float], int]] | _RunningMean,
+) -> dict[str, float]:
     """Compute weighted-average composite from per-batch scores.
 
     Weights: accuracy 0.4, naturalness 0.3, terminology 0.15,
     cultural_adaptation 0.15.
 
+    *batch_scores* may be a list of score dicts, a list of
+    ``(scores, triple_count)`` tuples, or an already-filled
+    :class:`_RunningMean`.  Counted batches contribute in proportion to the
+    triples they cover, so a short final batch does not weigh as much as a
+    full one; bare dicts count once each.
+
     Returns a dict with the four dimension averages and the composite.
     """
-    if not batch_scores:
-        return {
-            "accuracy": 0.0,
-            "naturalness": 0.0,
-            "terminology": 0.0,
-            "cultural_adaptation": 0.0,
-            "composite": 0.0,
-        }
-
-    n = len(batch_scores)
-    avg: dict[str, float] = {
-        "accuracy": sum(s["accuracy"] for s in batch_scores) / n,
-        "naturalness": sum(s["naturalness"] for s in batch_scores) / n,
-        "terminology": sum(s["terminology"] for s in batch_scores) / n,
-        "cultural_adaptation": sum(s["cultural_adaptation"] for s in batch_scores) / n,
-    }
+    if isinstance(batch_scores, _RunningMean):
+        return batch_scores.finalize()
 
-    avg["composite"] = (
-        0.4 * avg["accuracy"]
-        + 0.3 * avg["naturalness"]
-        + 0.15 * avg["terminology"]
-        + 0.15 * avg["cultural_adaptation"]
-    )
-
-    return avg
+    running = _RunningMean()
+    for entry in batch_scores:
+        if isinstance(entry, tuple):
+            running.add(*entry)
+        else:
+            running.add(entry)
+    return running.finalize()
 
 
 # ---------------------------------------------------------------------------
@@ -350,41 +693,28 @@ def _detect_language(
         A human-readable language name: ``"Japanese"``, ``"Chinese"``,
         ``"Korean"``, or ``"English"``.
     """
-    cjk = 0
-    hiragana_katakana = 0
-    hangul = 0
-    total = 0
-
     # Sample from reference segments (second element)
-    for _gen, ref in pairs:
-        text = ref.get(field, "")
-        for ch in text:
-            if ch.isspace():
-                continue
-            cp = ord(ch)
-            total += 1
-            for lo, hi in _CJK_RANGES:
-                if lo <= cp <= hi:
-                    cjk += 1
-                    break
-            # Sub-classify
-            if _HIRAGANA[0] <= cp <= _HIRAGANA[1] or _KATAKANA[0] <= cp <= _KATAKANA[1]:
-                hiragana_katakana += 1
-            for lo, hi in _HANGUL_RANGES:
-                if lo <= cp <= hi:
-                    hangul += 1
-                    break
+    text = "\n".join(ref.get(field, "") for _gen, ref in pairs)
+
+    # ASCII text contains no CJK at all: the verdict is fixed without a scan
+    if text.isascii():
+        return "English"
+
+    # ``\s`` drops exactly what ``str.isspace`` would
+    visible = _WHITESPACE_RE.sub("", text)
+    total = len(visible)
 
     if total == 0:
         return "English"
 
+    cjk = sum(map(len, _CJK_RUN_RE.findall(visible)))
     cjk_ratio = cjk / total
     if cjk_ratio <= 0.3:
         return "English"
 
     # Among CJK characters, distinguish Japanese / Korean / Chinese
-    if hiragana_katakana > 0:
+    if _KANA_RE.search(visible):
         return "Japanese"
-    if hangul > 0:
+    if _HANGUL_RE.search(visible):
         return "Korean"
     return "Chinese"
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import pytest
 
 from benchmark.scripts.asr_eval import (
@@ -9,8 +11,11 @@ from benchmark.scripts.asr_eval import (
     compute_cer,
     compute_timestamp_metrics,
     compute_wer,
+    compute_wer_cer,
     detect_metric_type,
     evaluate_asr,
+    evaluate_asr_prealigned,
+    split_by_type,
     temporal_overlap,
     text_similarity,
 )
@@ -99,6 +104,20 @@ class TestTextSimilarity:
         sim = text_similarity("a", "a")
         assert sim == pytest.approx(1.0)
 
+    @patch("benchmark.scripts.asr_eval.fuzz", None)
+    def test_difflib_fallback(self):
+        text_similarity.cache_clear()
+        assert text_similarity("Hello world", "Hello world") == pytest.approx(1.0)
+        assert text_similarity("abc", "xyz") == pytest.approx(0.0)
+        assert 0.0 < text_similarity("Hello world", "Hello there") < 1.0
+        text_similarity.cache_clear()
+
+    def test_repeated_pairs_are_cached(self):
+        text_similarity.cache_clear()
+        text_similarity("Hello world", "Hello there")
+        text_similarity("Hello world", "Hello there")
+        assert text_similarity.cache_info().hits == 1
+
 
 # ===================================================================
 # Unit tests — detect_metric_type
@@ -184,6 +203,44 @@ class TestComputeCer:
         assert compute_cer("", "") == pytest.approx(0.0)
 
 
+class TestComputeWerCer:
+    def test_identical(self):
+        wer, cer = compute_wer_cer("hello world", "hello world")
+        assert wer == pytest.approx(0.0)
+        assert cer == pytest.approx(0.0)
+
+    def test_matches_individual_metrics(self):
+        hyp, ref = "hello there", "hello world"
+        wer, cer = compute_wer_cer(hyp, ref)
+        assert wer == pytest.approx(compute_wer(hyp, ref))
+        assert cer == pytest.approx(compute_cer(hyp, ref))
+
+    def test_empty_reference(self):
+        assert compute_wer_cer("", "") == (0.0, 0.0)
+        assert compute_wer_cer("some text", "") == (1.0, 1.0)
+
+
+# ===================================================================
+# Unit tests — split_by_type
+# ===================================================================
+
+
+class TestSplitByType:
+    def test_partitions_and_preserves_order(self):
+        segs = [
+            {"source": "a", "type": "dialogue"},
+            {"source": "b", "type": "lyrics"},
+            {"source": "c"},
+            {"source": "d", "type": "lyrics"},
+        ]
+        dialogue, lyrics = split_by_type(segs)
+        assert [s["source"] for s in dialogue] == ["a", "c"]
+        assert [s["source"] for s in lyrics] == ["b", "d"]
+
+    def test_empty(self):
+        assert split_by_type([]) == ([], [])
+
+
 # ===================================================================
 # Unit tests — align_segments
 # ===================================================================
@@ -282,6 +339,21 @@ class TestAlignSegments:
         # Should match by text despite timing mismatch
         assert pairs[0][1]["source"] == "Hello world"
 
+    def test_unsorted_reference(self):
+        """Reference order must not affect timing-based matching."""
+        gen = [
+            {"start": 1.0, "end": 3.0, "source": "A"},
+            {"start": 4.0, "end": 6.0, "source": "A"},
+        ]
+        ref = [
+            {"start": 4.0, "end": 6.0, "source": "A"},
+            {"start": 0.0, "end": 3.0, "source": "A"},
+        ]
+        pairs = align_segments(gen, ref)
+        assert len(pairs) == 2
+        for gen_seg, ref_seg in pairs:
+            assert temporal_overlap(gen_seg, ref_seg) > 0.0
+
 
 # ===================================================================
 # Unit tests — compute_timestamp_metrics
@@ -444,3 +516,36 @@ class TestEvaluateAsr:
         assert result["text_metrics"]["num_segments"] == 0
         # But lyrics_bonus should exist
         assert result["lyrics_bonus"] is not None
+
+
+# ===================================================================
+# Integration test — evaluate_asr_prealigned
+# ===================================================================
+
+
+class TestEvaluateAsrPrealigned:
+    def test_empty_pairs(self):
+        assert evaluate_asr_prealigned([], None) == evaluate_asr([], [])
+
+    def test_matches_evaluate_asr(self):
+        gen = [
+            {"start": 1.0, "end": 3.0, "source": "Hello world", "type": "dialogue"},
+            {"start": 10.0, "end": 12.0, "source": "La la la", "type": "lyrics"},
+        ]
+        ref = [
+            {"start": 1.0, "end": 3.0, "source": "Hello world", "type": "dialogue"},
+            {"start": 10.0, "end": 12.0, "source": "La la la", "type": "lyrics"},
+        ]
+        dialogue_pairs = align_segments(gen[:1], ref[:1])
+        lyrics_pairs = align_segments(gen[1:], ref[1:])
+        result = evaluate_asr_prealigned(dialogue_pairs, lyrics_pairs)
+        assert result == evaluate_asr(gen, ref)
+
+    def test_no_lyrics_pairs(self):
+        pairs = [
+            ({"start": 1.0, "end": 3.0, "source": "Hello"},
+             {"start": 1.0, "end": 3.0, "source": "Hello"}),
+        ]
+        result = evaluate_asr_prealigned(pairs)
+        assert result["lyrics_bonus"] is None
+        assert result["timestamp_metrics"]["mean_iou"] == pytest.approx(1.0)
@@ -13,6 +13,7 @@ from benchmark.scripts.preprocess import (
     _classify_script,
     _detect_lyrics_styles,
     _detect_main_style,
+    _detect_styles,
     _filter_noise,
     _is_credits,
     _lang_to_script,
@@ -22,6 +23,7 @@ from benchmark.scripts.preprocess import (
     _split_bilingual,
     _strip_ass_tags,
     preprocess,
+    preprocess_many,
 )
 
 FIXTURES = Path(__file__).parent / "fixtures"
@@ -314,6 +316,26 @@ class TestDetectLyricsStyles:
         assert "opening" in _detect_lyrics_styles(segs)
 
 
+# ===================================================================
+# Unit tests — _detect_styles
+# ===================================================================
+
+
+class TestDetectStyles:
+    def test_main_and_lyrics_together(self):
+        segs = [
+            {"style": "OP", "line_type": "dialogue"},
+            {"style": "OP", "line_type": "dialogue"},
+            {"style": "OP", "line_type": "dialogue"},
+            {"style": "Default", "line_type": "dialogue"},
+            {"style": "Sign", "line_type": "comment"},
+        ]
+        assert _detect_styles(segs) == ("Default", {"OP"})
+
+    def test_empty_list(self):
+        assert _detect_styles([]) == (None, set())
+
+
 # ===================================================================
 # Unit tests — _filter_noise
 # ===================================================================
@@ -420,6 +442,14 @@ class TestFilterNoise:
         result = _filter_noise(segs, None, set())
         assert len(result) == 2
 
+    def test_attaches_stripped_text(self):
+        segs = [
+            {"start": 1, "end": 3, "text": r"{\an8} Hello {\i1}world{\i0} ",
+             "style": "Default", "line_type": "dialogue"},
+        ]
+        result = _filter_noise(segs, "Default", set())
+        assert result[0]["text_clean"] == "Hello world"
+
 
 # ===================================================================
 # Unit tests — _is_credits
@@ -905,3 +935,23 @@ Comment: 0,0:00:01.00,0:00:03.00,Default,,0,0,0,,Only comments here
         f.write_text("")
         result = preprocess(f)
         assert result == []
+
+
+# ===================================================================
+# Batch preprocessing
+# ===================================================================
+
+
+class TestPreprocessMany:
+    FILES = [FIXTURES / "simple.ass", FIXTURES / "lyrics.ass", FIXTURES / "bilingual.ass"]
+
+    def test_sequential_matches_preprocess(self):
+        result = preprocess_many(self.FILES, workers=1)
+        assert result == [preprocess(f) for f in self.FILES]
+
+    def test_parallel_matches_preprocess(self):
+        result = preprocess_many(self.FILES, source_lang="en", workers=2)
+        assert result == [preprocess(f, source_lang="en") for f in self.FILES]
+
+    def test_empty_input(self):
+        assert preprocess_many([]) == []
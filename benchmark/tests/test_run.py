@@ -0,0 +1,186 @@
+"""Tests for benchmark.scripts.run."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import click
+import pytest
+
+from benchmark.scripts.run import (
+    _REPO_ROOT,
+    _parse_args,
+    _run_subgen,
+    _run_subgen_in_process,
+    main_many,
+)
+from subgen import cli as subgen_cli
+
+
+class TestRunSubgenInProcess:
+    def _run(self, **kwargs):
+        with patch.object(subgen_cli, "main", **kwargs) as main:
+            code = _run_subgen_in_process(["run", "video.mp4"])
+        return code, main
+
+    def test_none_return_is_success(self):
+        code, main = self._run(return_value=None)
+        assert code == 0
+        main.assert_called_once_with(
+            args=["run", "video.mp4"], prog_name="subgen", standalone_mode=False,
+        )
+
+    def test_int_return_is_exit_code(self):
+        code, _ = self._run(return_value=3)
+        assert code == 3
+
+    def test_click_exception_uses_its_exit_code(self):
+        code, _ = self._run(side_effect=click.UsageError("bad option"))
+        assert code == click.UsageError.exit_code
+
+    def test_abort_is_failure(self):
+        code, _ = self._run(side_effect=click.Abort())
+        assert code == 1
+
+    @pytest.mark.parametrize("exit_code, expected", [
+        (None, 0),
+        (0, 0),
+        (2, 2),
+        ("fatal", 1),
+    ])
+    def test_system_exit_mapping(self, exit_code, expected):
+        code, _ = self._run(side_effect=SystemExit(exit_code))
+        assert code == expected
+
+    def test_runs_from_repo_root_and_restores_cwd(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        seen = []
+        code, _ = self._run(side_effect=lambda **kw: seen.append(os.getcwd()))
+        assert code == 0
+        assert seen == [str(_REPO_ROOT)]
+        assert os.getcwd() == str(tmp_path)
+
+    def test_restores_cwd_on_error(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        self._run(side_effect=SystemExit(1))
+        assert os.getcwd() == str(tmp_path)
+
+
+class TestRunSubgen:
+    def test_isolated_runs_subprocess(self, tmp_path):
+        output = tmp_path / "out.ass"
+        with patch("benchmark.scripts.run.subprocess.run",
+                   return_value=subprocess.CompletedProcess([], 0)) as run, \
+                patch("benchmark.scripts.run._run_subgen_in_process") as in_process:
+            _run_subgen(tmp_path / "video.mp4", output,
+                        whisper_provider="cpp", isolated=True)
+        in_process.assert_not_called()
+        cmd = run.call_args[0][0]
+        assert cmd[:3] == [sys.executable, str(_REPO_ROOT / "subgen.py"), "run"]
+        assert cmd[cmd.index("--output") + 1] == str(output)
+        assert cmd[cmd.index("--whisper-provider") + 1] == "cpp"
+        assert run.call_args.kwargs["cwd"] == str(_REPO_ROOT)
+
+    def test_isolated_nonzero_exit_raises(self, tmp_path):
+        with patch("benchmark.scripts.run.subprocess.run",
+                   return_value=subprocess.CompletedProcess([], 2)):
+            with pytest.raises(RuntimeError, match="code 2"):
+                _run_subgen(tmp_path / "video.mp4", tmp_path / "out.ass", isolated=True)
+
+    def test_in_process_by_default(self, tmp_path):
+        with patch("benchmark.scripts.run.subprocess.run") as run, \
+                patch("benchmark.scripts.run._run_subgen_in_process",
+                      return_value=0) as in_process:
+            _run_subgen(tmp_path / "video.mp4", tmp_path / "out.ass",
+                        force_transcribe=True)
+        run.assert_not_called()
+        args = in_process.call_args[0][0]
+        assert args[0] == "run"
+        assert "--force-transcribe" in args
+
+    def test_in_process_nonzero_exit_raises(self, tmp_path):
+        with patch("benchmark.scripts.run._run_subgen_in_process", return_value=1):
+            with pytest.raises(RuntimeError, match="code 1"):
+                _run_subgen(tmp_path / "video.mp4", tmp_path / "out.ass")
+
+
+def _make_samples(tmp_path, count):
+    dirs = []
+    for i in range(count):
+        sample = tmp_path / f"sample-{i:03d}"
+        sample.mkdir()
+        (sample / "video.mp4").touch()
+        (sample / "reference.ass").touch()
+        dirs.append(str(sample))
+    return dirs
+
+
+def _fake_run_subgen(video_path, output_path, **kwargs):
+    # Earlier samples finish last, so ordering must come from main_many
+    time.sleep(0.05 * (3 - int(video_path.parent.name[-1])))
+    output_path.touch()
+
+
+def _fake_compare(*, generated_path, reference_path, output_path, **kwargs):
+    return {"sample": os.path.basename(os.path.dirname(generated_path))}
+
+
+class TestMainMany:
+    @pytest.fixture(autouse=True)
+    def _mock_pipeline(self, tmp_path):
+        with patch("benchmark.scripts.run._run_subgen",
+                   side_effect=_fake_run_subgen) as run_subgen, \
+                patch("benchmark.scripts.run.compare_main",
+                      side_effect=_fake_compare), \
+                patch("benchmark.scripts.run._REPO_ROOT", tmp_path):
+            self.run_subgen = run_subgen
+            yield
+
+    def test_parallel_reports_in_input_order(self, tmp_path):
+        samples = _make_samples(tmp_path, 3)
+        with patch("benchmark.scripts.run.ProcessPoolExecutor",
+                   wraps=ThreadPoolExecutor) as pool_cls:
+            reports = main_many(samples, workers=3, no_translation=True)
+        pool_cls.assert_called_once_with(max_workers=3)
+        assert [r["sample"] for r in reports] == [
+            "sample-000", "sample-001", "sample-002",
+        ]
+        assert self.run_subgen.call_count == 3
+
+    def test_kwargs_forwarded_to_every_sample(self, tmp_path):
+        samples = _make_samples(tmp_path, 2)
+        main_many(samples, workers=1, source_lang="ja", whisper_provider="cpp")
+        for call in self.run_subgen.call_args_list:
+            assert call.kwargs["source_lang"] == "ja"
+            assert call.kwargs["whisper_provider"] == "cpp"
+
+    def test_single_worker_stays_sequential(self, tmp_path):
+        samples = _make_samples(tmp_path, 3)
+        with patch("benchmark.scripts.run.ProcessPoolExecutor") as pool_cls:
+            reports = main_many(samples, workers=1)
+        pool_cls.assert_not_called()
+        assert [r["sample"] for r in reports] == [
+            "sample-000", "sample-001", "sample-002",
+        ]
+
+    def test_single_sample_stays_sequential(self, tmp_path):
+        samples = _make_samples(tmp_path, 1)
+        with patch("benchmark.scripts.run.ProcessPoolExecutor") as pool_cls:
+            reports = main_many(samples, workers=4)
+        pool_cls.assert_not_called()
+        assert len(reports) == 1
+
+
+class TestParseArgs:
+    def test_parallel_defaults_to_one(self):
+        assert _parse_args(["sample-001"]).parallel == 1
+
+    def test_parallel_short_flag(self):
+        args = _parse_args(["sample-001", "sample-002", "-j", "4"])
+        assert args.sample_dirs == ["sample-001", "sample-002"]
+        assert args.parallel == 4
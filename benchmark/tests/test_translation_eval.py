@@ -6,17 +6,23 @@ All HTTP calls to copilot-api are mocked to avoid real network requests.
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from benchmark.scripts.translation_eval import (
     _aggregate_scores,
+    _RunningMean,
     _batch_triples,
     _build_prompt,
+    _cached_call_llm,
     _call_llm,
     _detect_language,
+    _limiter_from_env,
     _parse_response,
+    _RateLimiter,
+    _retry_delay,
     evaluate_translation,
 )
 
@@ -132,6 +138,23 @@ class TestBatchTriples:
         assert len(batches) == 4  # 3, 3, 3, 1
         assert len(batches[3]) == 1
 
+    def test_default_packs_more_than_twenty(self):
+        triples = [("a", "b", "c")] * 45
+        batches = _batch_triples(triples)
+        assert len(batches) == 1
+
+    def test_char_budget_splits_batches(self):
+        long_text = "x" * 1000
+        triples = [(long_text, long_text, long_text)] * 5
+        batches = _batch_triples(triples, batch_size=50, max_prompt_chars=7000)
+        assert [len(b) for b in batches] == [2, 2, 1]
+
+    def test_oversized_triple_gets_own_batch(self):
+        huge = ("x" * 20000, "y", "z")
+        batches = _batch_triples([("a", "b", "c"), huge, ("d", "e", "f")],
+                                 max_prompt_chars=1000)
+        assert [len(b) for b in batches] == [1, 1, 1]
+
 
 # ===================================================================
 # Unit tests — _parse_response
@@ -197,6 +220,35 @@ class TestParseResponse:
         result = _parse_response("{}")
         assert result is None
 
+    def test_fenced_json(self):
+        response = (
+            "```json\n"
+            '{\n  "accuracy": 8.0,\n  "naturalness": 7.0,\n'
+            '  "terminology": 9.0,\n  "cultural_adaptation": 6.0\n}\n'
+            "```"
+        )
+        result = _parse_response(response)
+        assert result is not None
+        assert result["terminology"] == pytest.approx(9.0)
+
+    def test_brace_inside_string_value(self):
+        response = (
+            'Scores: {"accuracy": 8, "naturalness": 7, "terminology": 9, '
+            '"cultural_adaptation": 6, "note": "kept the {name} placeholder"} done'
+        )
+        result = _parse_response(response)
+        assert result is not None
+        assert result["accuracy"] == pytest.approx(8.0)
+
+    def test_nested_in_wrapper_object(self):
+        response = (
+            'Result: {"scores": {"accuracy": 8, "naturalness": 7, '
+            '"terminology": 9, "cultural_adaptation": 6}}'
+        )
+        result = _parse_response(response)
+        assert result is not None
+        assert result["cultural_adaptation"] == pytest.approx(6.0)
+
 
 # ===================================================================
 # Unit tests — _aggregate_scores
@@ -244,6 +296,34 @@ class TestAggregateScores:
         result = _aggregate_scores(scores)
         assert result["composite"] == pytest.approx(1.0)
 
+    def test_running_mean_matches_list(self):
+        scores = [
+            {"accuracy": 8.0, "naturalness": 6.0, "terminology": 8.0, "cultural_adaptation": 6.0},
+            {"accuracy": 6.0, "naturalness": 8.0, "terminology": 6.0, "cultural_adaptation": 8.0},
+        ]
+        running = _RunningMean()
+        for s in scores:
+            running.add(s)
+        assert _aggregate_scores(running) == _aggregate_scores(scores)
+
+    def test_counted_batches_weighted(self):
+        scores = [
+            ({"accuracy": 8.0, "naturalness": 8.0, "terminology": 8.0, "cultural_adaptation": 8.0}, 20),
+            ({"accuracy": 2.0, "naturalness": 2.0, "terminology": 2.0, "cultural_adaptation": 2.0}, 5),
+        ]
+        result = _aggregate_scores(scores)
+        # (8*20 + 2*5) / 25 = 6.8
+        assert result["accuracy"] == pytest.approx(6.8)
+        assert result["composite"] == pytest.approx(6.8)
+
+    def test_running_mean_weighted(self):
+        running = _RunningMean()
+        running.add({"accuracy": 8.0, "naturalness": 8.0, "terminology": 8.0, "cultural_adaptation": 8.0}, 3)
+        running.add({"accuracy": 4.0, "naturalness": 4.0, "terminology": 4.0, "cultural_adaptation": 4.0}, 1)
+        result = _aggregate_scores(running)
+        assert result["accuracy"] == pytest.approx(7.0)
+        assert result["composite"] == pytest.approx(7.0)
+
 
 # ===================================================================
 # Unit tests — _detect_language
@@ -299,84 +379,246 @@ class TestDetectLanguage:
 
 
 class TestCallLlm:
+    @pytest.fixture(autouse=True)
+    def no_backoff_sleep(self):
+        with patch("benchmark.scripts.translation_eval.time.sleep") as sleep:
+            yield sleep
+
+    @patch("benchmark.scripts.translation_eval._CLIENT", None)
     @patch("benchmark.scripts.translation_eval.httpx")
     def test_successful_call(self, mock_httpx):
         mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "content": [{"text": '{"accuracy": 8.0}'}]
-        }
+        }).encode()
         mock_response.raise_for_status = MagicMock()
-        mock_httpx.post.return_value = mock_response
+        mock_httpx.Client.return_value.post.return_value = mock_response
 
         result = _call_llm("test prompt")
         assert result == '{"accuracy": 8.0}'
-        mock_httpx.post.assert_called_once()
+        mock_httpx.Client.return_value.post.assert_called_once()
 
+    @patch("benchmark.scripts.translation_eval._CLIENT", None)
     @patch("benchmark.scripts.translation_eval.httpx")
     def test_connection_error(self, mock_httpx):
         mock_httpx.HTTPError = Exception
         mock_httpx.TimeoutException = Exception
-        mock_httpx.post.side_effect = ConnectionError("Connection refused")
+        mock_httpx.Client.return_value.post.side_effect = ConnectionError("Connection refused")
 
         result = _call_llm("test prompt")
         assert result is None
 
+    @patch("benchmark.scripts.translation_eval._CLIENT", None)
     @patch("benchmark.scripts.translation_eval.httpx")
     def test_timeout(self, mock_httpx):
         mock_httpx.HTTPError = Exception
         mock_httpx.TimeoutException = type("TimeoutException", (Exception,), {})
-        mock_httpx.post.side_effect = mock_httpx.TimeoutException("timeout")
+        mock_httpx.Client.return_value.post.side_effect = mock_httpx.TimeoutException("timeout")
 
         result = _call_llm("test prompt")
         assert result is None
 
+    @patch("benchmark.scripts.translation_eval._CLIENT", None)
     @patch("benchmark.scripts.translation_eval.httpx")
     def test_http_error(self, mock_httpx):
         mock_httpx.HTTPError = type("HTTPError", (Exception,), {})
         mock_httpx.TimeoutException = Exception
-        mock_httpx.post.side_effect = mock_httpx.HTTPError("500 Server Error")
+        mock_httpx.Client.return_value.post.side_effect = mock_httpx.HTTPError("500 Server Error")
 
         result = _call_llm("test prompt")
         assert result is None
 
+    @patch("benchmark.scripts.translation_eval._CLIENT", None)
     @patch("benchmark.scripts.translation_eval.httpx")
     def test_empty_content(self, mock_httpx):
         mock_response = MagicMock()
-        mock_response.json.return_value = {"content": []}
+        mock_response.content = b'{"content": []}'
         mock_response.raise_for_status = MagicMock()
-        mock_httpx.post.return_value = mock_response
+        mock_httpx.Client.return_value.post.return_value = mock_response
 
         result = _call_llm("test prompt")
         assert result is None
 
+    @patch("benchmark.scripts.translation_eval._CLIENT", None)
     @patch("benchmark.scripts.translation_eval.httpx")
     def test_uses_correct_model(self, mock_httpx):
         mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "content": [{"text": "response"}]
-        }
+        }).encode()
         mock_response.raise_for_status = MagicMock()
-        mock_httpx.post.return_value = mock_response
+        mock_httpx.Client.return_value.post.return_value = mock_response
 
         _call_llm("test prompt")
-        call_args = mock_httpx.post.call_args
+        call_args = mock_httpx.Client.return_value.post.call_args
         payload = call_args[1]["json"] if "json" in call_args[1] else call_args[0][1]
         assert payload["model"] == "claude-opus-4.6"
 
+    @patch("benchmark.scripts.translation_eval._CLIENT", None)
     @patch("benchmark.scripts.translation_eval.httpx")
     def test_uses_correct_endpoint(self, mock_httpx):
         mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "content": [{"text": "response"}]
-        }
+        }).encode()
         mock_response.raise_for_status = MagicMock()
-        mock_httpx.post.return_value = mock_response
+        mock_httpx.Client.return_value.post.return_value = mock_response
 
         _call_llm("test prompt")
-        call_args = mock_httpx.post.call_args
+        call_args = mock_httpx.Client.return_value.post.call_args
         url = call_args[0][0]
         assert url == "http://localhost:4141/v1/messages"
 
+    @patch("benchmark.scripts.translation_eval._CLIENT", None)
+    @patch("benchmark.scripts.translation_eval.httpx")
+    def test_client_reused_across_calls(self, mock_httpx):
+        mock_response = MagicMock()
+        mock_response.content = json.dumps({
+            "content": [{"text": "response"}]
+        }).encode()
+        mock_response.raise_for_status = MagicMock()
+        mock_httpx.Client.return_value.post.return_value = mock_response
+
+        _call_llm("first prompt")
+        _call_llm("second prompt")
+        mock_httpx.Client.assert_called_once()
+        assert mock_httpx.Client.return_value.post.call_count == 2
+
+    @patch("benchmark.scripts.translation_eval._CLIENT", None)
+    @patch("benchmark.scripts.translation_eval.httpx")
+    def test_transient_error_retried(self, mock_httpx, no_backoff_sleep):
+        mock_httpx.HTTPError = Exception
+        mock_httpx.TimeoutException = type("TimeoutException", (Exception,), {})
+        mock_response = MagicMock()
+        mock_response.content = json.dumps({"content": [{"text": "response"}]}).encode()
+        mock_httpx.Client.return_value.post.side_effect = [
+            mock_httpx.TimeoutException("timeout"),
+            mock_response,
+        ]
+
+        assert _call_llm("test prompt") == "response"
+        assert mock_httpx.Client.return_value.post.call_count == 2
+        no_backoff_sleep.assert_called_once()
+
+    @patch("benchmark.scripts.translation_eval._CLIENT", None)
+    @patch("benchmark.scripts.translation_eval.httpx")
+    def test_gives_up_after_max_attempts(self, mock_httpx, no_backoff_sleep):
+        mock_httpx.HTTPError = Exception
+        mock_httpx.TimeoutException = Exception
+        mock_httpx.Client.return_value.post.side_effect = ConnectionError("reset")
+
+        assert _call_llm("test prompt") is None
+        assert mock_httpx.Client.return_value.post.call_count == 4
+        assert no_backoff_sleep.call_count == 3
+
+    @patch("benchmark.scripts.translation_eval._CLIENT", None)
+    @patch("benchmark.scripts.translation_eval.httpx")
+    def test_client_error_not_retried(self, mock_httpx, no_backoff_sleep):
+        error = type("HTTPError", (Exception,), {})("401 Unauthorized")
+        error.response = MagicMock(status_code=401)
+        mock_httpx.HTTPError = type(error)
+        mock_httpx.TimeoutException = type("TimeoutException", (Exception,), {})
+        mock_httpx.Client.return_value.post.side_effect = error
+
+        assert _call_llm("test prompt") is None
+        mock_httpx.Client.return_value.post.assert_called_once()
+        no_backoff_sleep.assert_not_called()
+
+
+class TestRateLimiter:
+    def test_burst_up_to_capacity(self):
+        limiter = _RateLimiter(3, period=60.0)
+        with patch("benchmark.scripts.translation_eval.time.sleep") as sleep:
+            for _ in range(3):
+                limiter.acquire()
+        sleep.assert_not_called()
+
+    def test_blocks_until_refilled(self):
+        clock = [1000.0]
+        with patch("benchmark.scripts.translation_eval.time.monotonic", lambda: clock[0]), \
+                patch("benchmark.scripts.translation_eval.time.sleep") as sleep:
+            sleep.side_effect = lambda seconds: clock.__setitem__(0, clock[0] + seconds)
+            limiter = _RateLimiter(2, period=60.0)
+            limiter.acquire()
+            limiter.acquire()
+            limiter.acquire()
+        # One token refills every 30 s
+        sleep.assert_called_once()
+        assert sleep.call_args[0][0] == pytest.approx(30.0)
+
+    def test_sub_one_rate_still_acquires(self):
+        clock = [1000.0]
+        with patch("benchmark.scripts.translation_eval.time.monotonic", lambda: clock[0]), \
+                patch("benchmark.scripts.translation_eval.time.sleep") as sleep:
+            sleep.side_effect = lambda seconds: clock.__setitem__(0, clock[0] + seconds)
+            limiter = _RateLimiter(0.5, period=60.0)
+            limiter.acquire()
+            limiter.acquire()
+        # Half a call per minute: the second waits two minutes
+        sleep.assert_called_once()
+        assert sleep.call_args[0][0] == pytest.approx(120.0)
+
+    def test_disabled_with_zero_rpm(self, monkeypatch):
+        monkeypatch.setenv("SUBGEN_LLM_RPM", "0")
+        assert _limiter_from_env() is None
+
+    def test_invalid_rpm_uses_default(self, monkeypatch):
+        monkeypatch.setenv("SUBGEN_LLM_RPM", "fast")
+        assert _limiter_from_env().capacity == pytest.approx(500.0)
+
+
+class TestRetryDelay:
+    def test_honours_retry_after(self):
+        exc = Exception("429 Too Many Requests")
+        exc.response = MagicMock(status_code=429, headers={"Retry-After": "7"})
+        assert _retry_delay(exc, 0) == pytest.approx(7.0)
+
+    def test_exponential_backoff(self):
+        exc = ConnectionError("reset")
+        assert 0.5 <= _retry_delay(exc, 0) <= 0.75
+        assert 4.0 <= _retry_delay(exc, 3) <= 4.25
+
+    def test_delay_capped(self):
+        exc = ConnectionError("reset")
+        assert _retry_delay(exc, 20) <= 60.25
+
+    def test_non_retryable_status(self):
+        exc = Exception("404 Not Found")
+        exc.response = MagicMock(status_code=404, headers={})
+        assert _retry_delay(exc, 0) is None
+
+
+# ===================================================================
+# Unit tests — _cached_call_llm (mocked)
+# ===================================================================
+
+
+class TestCachedCallLlm:
+    @patch("benchmark.scripts.translation_eval._call_llm")
+    def test_disabled_by_default(self, mock_call):
+        mock_call.return_value = "reply"
+        with patch("benchmark.scripts.translation_eval._CACHE_DIR", None):
+            assert _cached_call_llm("prompt") == "reply"
+            assert _cached_call_llm("prompt") == "reply"
+        assert mock_call.call_count == 2
+
+    @patch("benchmark.scripts.translation_eval._call_llm")
+    def test_second_call_served_from_disk(self, mock_call, tmp_path):
+        mock_call.return_value = "reply"
+        with patch("benchmark.scripts.translation_eval._CACHE_DIR", str(tmp_path)):
+            assert _cached_call_llm("prompt") == "reply"
+            assert _cached_call_llm("prompt") == "reply"
+            assert _cached_call_llm("other prompt") == "reply"
+        assert mock_call.call_count == 2
+
+    @patch("benchmark.scripts.translation_eval._call_llm")
+    def test_failures_not_cached(self, mock_call, tmp_path):
+        mock_call.side_effect = [None, "reply"]
+        with patch("benchmark.scripts.translation_eval._CACHE_DIR", str(tmp_path)):
+            assert _cached_call_llm("prompt") is None
+            assert _cached_call_llm("prompt") == "reply"
+        assert mock_call.call_count == 2
+
 
 # ===================================================================
 # Integration test — evaluate_translation (mocked LLM)
@@ -468,6 +710,29 @@ class TestEvaluateTranslation:
         result = evaluate_translation(pairs)
         assert result is None
 
+    @patch("benchmark.scripts.translation_eval._call_llm")
+    def test_unparseable_reply_retried_once(self, mock_call):
+        mock_call.side_effect = [
+            "Sure! The translations look good overall.",
+            json.dumps({
+                "accuracy": 8.0,
+                "naturalness": 7.0,
+                "terminology": 9.0,
+                "cultural_adaptation": 6.0,
+            }),
+        ]
+
+        pairs = [
+            (
+                {"source": "Hello", "translation": "你好", "type": "dialogue"},
+                {"source": "Hello", "translation": "你好", "type": "dialogue"},
+            ),
+        ]
+        result = evaluate_translation(pairs)
+        assert result is not None
+        assert mock_call.call_count == 2
+        assert "JSON object only" in mock_call.call_args[0][0]
+
     @patch("benchmark.scripts.translation_eval._call_llm")
     def test_auto_language_detection(self, mock_call):
         mock_call.return_value = json.dumps({
@@ -488,3 +753,145 @@ class TestEvaluateTranslation:
         # Prompt should have been built with detected languages
         call_args = mock_call.call_args[0][0]
         assert "Japanese" in call_args or "Chinese" in call_args
+
+    @patch("benchmark.scripts.translation_eval._call_llm")
+    def test_all_batches_scored(self, mock_call):
+        mock_call.return_value = json.dumps({
+            "accuracy": 8.0,
+            "naturalness": 7.0,
+            "terminology": 9.0,
+            "cultural_adaptation": 6.0,
+        })
+
+        pairs = [
+            (
+                {"source": f"Line {i}", "translation": f"第{i}行", "type": "dialogue"},
+                {"source": f"Line {i}", "translation": f"第{i}行", "type": "dialogue"},
+            )
+            for i in range(120)
+        ]
+        result = evaluate_translation(pairs, source_lang="English", target_lang="Chinese")
+        assert result is not None
+        assert mock_call.call_count == 3
+
+    @patch("benchmark.scripts.translation_eval._call_llm")
+    def test_max_workers_one_scores_sequentially(self, mock_call):
+        mock_call.return_value = json.dumps({
+            "accuracy": 8.0,
+            "naturalness": 7.0,
+            "terminology": 9.0,
+            "cultural_adaptation": 6.0,
+        })
+
+        pairs = [
+            (
+                {"source": f"Line {i}", "translation": f"第{i}行", "type": "dialogue"},
+                {"source": f"Line {i}", "translation": f"第{i}行", "type": "dialogue"},
+            )
+            for i in range(120)
+        ]
+        with patch("benchmark.scripts.translation_eval.ThreadPoolExecutor",
+                   wraps=ThreadPoolExecutor) as pool_cls:
+            result = evaluate_translation(
+                pairs, source_lang="English", target_lang="Chinese", max_workers=1,
+            )
+        assert result is not None
+        assert mock_call.call_count == 3
+        pool_cls.assert_called_once_with(max_workers=1)
+
+    @patch("benchmark.scripts.translation_eval._MAX_CONNECTIONS", 2)
+    @patch("benchmark.scripts.translation_eval._call_llm")
+    def test_max_workers_capped_at_pool_size(self, mock_call):
+        mock_call.return_value = json.dumps({
+            "accuracy": 8.0,
+            "naturalness": 7.0,
+            "terminology": 9.0,
+            "cultural_adaptation": 6.0,
+        })
+
+        pairs = [
+            (
+                {"source": f"Line {i}", "translation": f"第{i}行", "type": "dialogue"},
+                {"source": f"Line {i}", "translation": f"第{i}行", "type": "dialogue"},
+            )
+            for i in range(120)
+        ]
+        with patch("benchmark.scripts.translation_eval.ThreadPoolExecutor",
+                   wraps=ThreadPoolExecutor) as pool_cls:
+            result = evaluate_translation(
+                pairs, source_lang="English", target_lang="Chinese", max_workers=50,
+            )
+        assert result is not None
+        pool_cls.assert_called_once_with(max_workers=2)
+
+    @patch("benchmark.scripts.translation_eval._call_llm")
+    def test_duplicate_triples_judged_once(self, mock_call):
+        mock_call.return_value = json.dumps({
+            "accuracy": 8.0,
+            "naturalness": 7.0,
+            "terminology": 9.0,
+            "cultural_adaptation": 6.0,
+        })
+
+        opening = (
+            {"source": "Opening", "translation": "片头", "type": "dialogue"},
+            {"source": "Opening", "translation": "片头", "type": "dialogue"},
+        )
+        pairs = [opening] * 5 + [
+            (
+                {"source": "Hello", "translation": "你好", "type": "dialogue"},
+                {"source": "Hello", "translation": "你好", "type": "dialogue"},
+            ),
+        ]
+        result = evaluate_translation(pairs, source_lang="English", target_lang="Chinese")
+        assert result is not None
+        prompt = mock_call.call_args[0][0]
+        assert prompt.count("Source (English): Opening") == 1
+        assert "--- Segment 2 ---" in prompt
+        assert "--- Segment 3 ---" not in prompt
+
+    @patch("benchmark.scripts.translation_eval._call_llm")
+    def test_short_last_batch_weighted_by_size(self, mock_call):
+        def reply(prompt):
+            score = 2.0 if "Line 55" in prompt else 8.0
+            return json.dumps({
+                "accuracy": score,
+                "naturalness": score,
+                "terminology": score,
+                "cultural_adaptation": score,
+            })
+
+        mock_call.side_effect = reply
+        pairs = [
+            (
+                {"source": f"Line {i}", "translation": f"第{i}行", "type": "dialogue"},
+                {"source": f"Line {i}", "translation": f"第{i}行", "type": "dialogue"},
+            )
+            for i in range(60)
+        ]
+        result = evaluate_translation(pairs, source_lang="English", target_lang="Chinese")
+        assert mock_call.call_count == 2
+        # Batches of 50 and 10 triples: (8*50 + 2*10) / 60 = 7.0
+        assert result["accuracy"] == pytest.approx(7.0)
+
+    @patch("benchmark.scripts.translation_eval._call_llm")
+    def test_failed_batch_skipped(self, mock_call):
+        ok = json.dumps({
+            "accuracy": 8.0,
+            "naturalness": 7.0,
+            "terminology": 9.0,
+            "cultural_adaptation": 6.0,
+        })
+        mock_call.side_effect = lambda prompt: None if "Line 110" in prompt else ok
+
+        pairs = [
+            (
+                {"source": f"Line {i}", "translation": f"第{i}行", "type": "dialogue"},
+                {"source": f"Line {i}", "translation": f"第{i}行", "type": "dialogue"},
+            )
+            for i in range(120)
+        ]
+        result = evaluate_translation(pairs, source_lang="English", target_lang="Chinese")
+        assert result is not None
+        assert result["accuracy"] == pytest.approx(8.0)
+        assert mock_call.call_count == 3
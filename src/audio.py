@@ -1,19 +1,36 @@
 """Audio extraction module"""
 
+import os
 import subprocess
 import shutil
+import wave
 from pathlib import Path
 from typing import Dict, Any
 
 
+# Tools already found on PATH. Only hits are remembered: a missing tool may
+# be installed later in the same process (e.g. by the setup wizard).
+_found_tools = set()
+
+
+def _tool_available(name: str) -> bool:
+    """Check PATH for an executable, remembering successful lookups"""
+    if name in _found_tools:
+        return True
+    if shutil.which(name) is None:
+        return False
+    _found_tools.add(name)
+    return True
+
+
 def check_ffmpeg() -> bool:
     """Check if FFmpeg is available"""
-    return shutil.which('ffmpeg') is not None
+    return _tool_available('ffmpeg')
 
 
 def check_ffprobe() -> bool:
     """Check if FFprobe is available"""
-    return shutil.which('ffprobe') is not None
+    return _tool_available('ffprobe')
 
 
 def extract_audio(video_path: Path, config: Dict[str, Any]) -> Path:
@@ -61,14 +78,17 @@ def extract_audio(video_path: Path, config: Dict[str, Any]) -> Path:
         str(audio_path)
     ]
 
+    # stdout is unused and stderr is only read on failure, so keep it as
+    # bytes and decode in the error path
     result = subprocess.run(
         cmd,
-        capture_output=True,
-        text=True
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
     )
 
     if result.returncode != 0:
-        raise RuntimeError(f"FFmpeg audio extraction failed: {result.stderr}")
+        stderr = result.stderr.decode('utf-8', 'replace')
+        raise RuntimeError(f"FFmpeg audio extraction failed: {stderr}")
 
     if not audio_path.exists():
         raise RuntimeError("Audio extraction failed: output file not created")
@@ -78,6 +98,14 @@ def extract_audio(video_path: Path, config: Dict[str, Any]) -> Path:
 
 def get_audio_duration(audio_path: Path) -> float:
     """Get audio duration in seconds"""
+    # PCM WAV (what extract_audio writes) records its length in the header,
+    # so no ffprobe process is needed; anything else falls back to ffprobe
+    try:
+        with wave.open(str(audio_path), 'rb') as wav:
+            return wav.getnframes() / wav.getframerate()
+    except (wave.Error, EOFError, OSError, ZeroDivisionError):
+        pass
+
     if not check_ffprobe():
         raise RuntimeError(
             "FFprobe is not installed or not in PATH.\n"
@@ -95,12 +123,13 @@ def get_audio_duration(audio_path: Path) -> float:
         str(audio_path)
     ]
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    result = subprocess.run(cmd, capture_output=True)
 
     if result.returncode != 0:
-        raise RuntimeError(f"Failed to get audio duration: {result.stderr}")
+        stderr = result.stderr.decode('utf-8', 'replace')
+        raise RuntimeError(f"Failed to get audio duration: {stderr}")
 
-    duration_str = result.stdout.strip()
+    duration_str = result.stdout.decode('utf-8', 'replace').strip()
     if not duration_str or duration_str == 'N/A':
         raise RuntimeError("Failed to parse audio duration: file may be corrupted")
 
@@ -116,9 +145,17 @@ def cleanup_temp_files(config: Dict[str, Any]) -> None:
         return
 
     temp_dir = Path(config.get('advanced', {}).get('temp_dir', '/tmp/subgen'))
-    if temp_dir.exists():
-        for f in temp_dir.glob('*_audio.wav'):
+    try:
+        entries = os.scandir(temp_dir)
+    except OSError:
+        return
+    # scandir yields names and cached types without a Path object or an
+    # extra stat per entry
+    with entries:
+        for entry in entries:
+            if not entry.name.endswith('_audio.wav') or entry.is_dir(follow_symlinks=False):
+                continue
             try:
-                f.unlink()
+                os.unlink(entry.path)
             except OSError:
                 pass
@@ -2,6 +2,7 @@
 
 import time
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional, Callable
 
 from .store import get_credential, save_credential
@@ -13,6 +14,10 @@ DEVICE_CODE_URL = "https://github.com/login/device/code"
 ACCESS_TOKEN_URL = "https://github.com/login/oauth/access_token"
 COPILOT_TOKEN_URL = "https://api.github.com/copilot_internal/v2/token"
 
+# Shared session so device-code polling reuses one keep-alive connection
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=0))
+
 
 class CopilotAuthError(Exception):
     """Copilot authentication error."""
@@ -21,7 +26,7 @@ class CopilotAuthError(Exception):
 
 def request_device_code() -> dict:
     """Request a device code from GitHub."""
-    response = requests.post(
+    response = _SESSION.post(
         DEVICE_CODE_URL,
         data={
             "client_id": CLIENT_ID,
@@ -57,7 +62,7 @@ def poll_for_access_token(device_code: str, interval: int, expires_in: int,
     poll_interval = max(interval, 5)  # Minimum 5 seconds
 
     while time.time() < expires_at:
-        response = requests.post(
+        response = _SESSION.post(
             ACCESS_TOKEN_URL,
             data={
                 "client_id": CLIENT_ID,
@@ -100,7 +105,7 @@ def poll_for_access_token(device_code: str, interval: int, expires_in: int,
 
 def get_copilot_token(github_token: str) -> dict:
     """Exchange GitHub token for Copilot API token."""
-    response = requests.get(
+    response = _SESSION.get(
         COPILOT_TOKEN_URL,
         headers={
             "Authorization": f"token {github_token}",
@@ -15,6 +15,7 @@ from urllib.parse import urlencode, urlparse, parse_qs
 from typing import Optional, Callable
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .store import get_credential, save_credential
 
@@ -28,6 +29,10 @@ SCOPE = "openid profile email offline_access"
 CHATGPT_API_URL = "https://chatgpt.com/backend-api"
 JWT_CLAIM_PATH = "https://api.openai.com/auth"
 
+# Shared session so token exchange and refresh reuse pooled connections
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=0))
+
 
 class OpenAICodexAuthError(Exception):
     """OpenAI Codex authentication error."""
@@ -121,7 +126,7 @@ class OAuthCallbackHandler(BaseHTTPRequestHandler):
 
 def _exchange_code_for_token(code: str, verifier: str) -> dict:
     """Exchange authorization code for tokens."""
-    response = requests.post(
+    response = _SESSION.post(
         TOKEN_URL,
         data={
             "grant_type": "authorization_code",
@@ -150,7 +155,7 @@ def _exchange_code_for_token(code: str, verifier: str) -> dict:
 
 def _refresh_access_token(refresh_token: str) -> dict:
     """Refresh the access token."""
-    response = requests.post(
+    response = _SESSION.post(
         TOKEN_URL,
         data={
             "grant_type": "refresh_token",
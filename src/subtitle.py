@@ -1,5 +1,6 @@
 """Subtitle generation module"""
 
+import re
 import subprocess
 from pathlib import Path
 from typing import Dict, Any, List, Optional
@@ -285,6 +286,12 @@ def add_subtitle_track(
         raise RuntimeError(f"Failed to add subtitle track: {result.stderr}")
 
 
+_SRT_BLOCK_SEP_RE = re.compile(r'\n\n+')
+_SRT_TIMESTAMP_RE = re.compile(
+    r'(\d{2}):(\d{2}):(\d{2})[,.](\d{3})\s*-->\s*(\d{2}):(\d{2}):(\d{2})[,.](\d{3})'
+)
+
+
 def load_srt(srt_path: Path, bilingual: bool = False) -> List:
     """
     Load an existing SRT file and return segments.
@@ -298,7 +305,6 @@ def load_srt(srt_path: Path, bilingual: bool = False) -> List:
         List of Segment objects with text (original) and translated fields
     """
     from .transcribe import Segment
-    import re
 
     if not srt_path.exists():
         raise FileNotFoundError(f"SRT file not found: {srt_path}")
@@ -309,10 +315,7 @@ def load_srt(srt_path: Path, bilingual: bool = False) -> List:
     segments = []
 
     # Parse SRT blocks (with or without numeric index lines).
-    blocks = re.split(r'\n\n+', content.strip())
-    timestamp_pattern = re.compile(
-        r'(\d{2}):(\d{2}):(\d{2})[,.](\d{3})\s*-->\s*(\d{2}):(\d{2}):(\d{2})[,.](\d{3})'
-    )
+    blocks = _SRT_BLOCK_SEP_RE.split(content.strip())
 
     for block in blocks:
         lines = block.strip().split('\n')
@@ -322,7 +325,7 @@ def load_srt(srt_path: Path, bilingual: bool = False) -> List:
         timestamp_match = None
         timestamp_line_idx = -1
         for idx, line in enumerate(lines):
-            timestamp_match = timestamp_pattern.match(line.strip())
+            timestamp_match = _SRT_TIMESTAMP_RE.match(line.strip())
             if timestamp_match:
                 timestamp_line_idx = idx
                 break
@@ -279,11 +279,14 @@ def validate_segments(segments: List[Segment], config: Dict[str, Any]) -> List[S
 
 # Global reference to keep model alive and prevent crash on garbage collection
 _model_ref = None
+# (model_name, device, compute_type) that _model_ref was loaded for, so repeat
+# in-process runs (e.g. benchmark sweeps) reuse it instead of reloading
+_model_key = None
 
 
 def _transcribe_local(audio_path: Path, config: Dict[str, Any]) -> List[Segment]:
     """Transcribe using local faster-whisper"""
-    global _model_ref
+    global _model_ref, _model_key
 
     try:
         from faster_whisper import WhisperModel
@@ -315,19 +318,25 @@ def _transcribe_local(audio_path: Path, config: Dict[str, Any]) -> List[Segment]
             # Try float16 first, fallback to float32 for older GPUs
             compute_type = "float16"
 
-    debug("transcribe_local: loading model with compute_type=%s", compute_type)
+    model_key = (model_name, device, compute_type)
 
-    # Load model with fallback for older GPUs
-    try:
-        model = WhisperModel(model_name, device=device, compute_type=compute_type)
-    except ValueError as e:
-        if "float16" in str(e) and compute_type == "float16":
-            print("  ⚠️  GPU doesn't support float16, using float32...")
-            compute_type = "float32"
-            debug("transcribe_local: fallback to compute_type=%s", compute_type)
+    if _model_ref is not None and _model_key == model_key:
+        debug("transcribe_local: reusing loaded model")
+        model = _model_ref
+    else:
+        debug("transcribe_local: loading model with compute_type=%s", compute_type)
+
+        # Load model with fallback for older GPUs
+        try:
             model = WhisperModel(model_name, device=device, compute_type=compute_type)
-        else:
-            raise
+        except ValueError as e:
+            if "float16" in str(e) and compute_type == "float16":
+                print("  ⚠️  GPU doesn't support float16, using float32...")
+                compute_type = "float32"
+                debug("transcribe_local: fallback to compute_type=%s", compute_type)
+                model = WhisperModel(model_name, device=device, compute_type=compute_type)
+            else:
+                raise
 
     debug("transcribe_local: model loaded, starting transcription...")
 
@@ -419,6 +428,7 @@ def _transcribe_local(audio_path: Path, config: Dict[str, Any]) -> List[Segment]
     # Keep model reference alive to prevent crash during garbage collection
     # The model will be cleaned up on next transcription or program exit
     _model_ref = model
+    _model_key = model_key
 
     debug("transcribe_local: about to return %d segments", len(segments))
     return segments
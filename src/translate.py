@@ -8,6 +8,12 @@ from typing import Dict, Any, List, Callable, Optional
 from .transcribe import Segment
 
 
+_LINE_BREAK_SPACE_RE = re.compile(r'\s*\n\s*')
+_SENTENCE_END_RE = re.compile(r'[.!?。！？…][\s"\'）\)]*$')
+_END_INDEX_RE = re.compile(r'end:\s*(\d+)')
+_LINE_NUMBERING_RE = re.compile(r'^\d+[\.\)]\s*')
+
+
 def _normalize_text_for_llm(text: str) -> str:
     """
     Normalize text for LLM input - replace newlines with placeholder.
@@ -27,8 +33,7 @@ def _restore_line_breaks(text: str) -> str:
     text = text.replace('[BR]', '\n')
     text = text.replace('(BR)', '\n')
     # Clean up extra spaces around newlines
-    import re
-    text = re.sub(r'\s*\n\s*', '\n', text)
+    text = _LINE_BREAK_SPACE_RE.sub('\n', text)
     return text.strip()
 
 
@@ -375,8 +380,6 @@ def _group_segments_by_sentence(segments: List[Segment], max_group_size: int = 1
     Returns:
         List of segment groups, where each group forms a complete sentence
     """
-    sentence_end = re.compile(r'[.!?。！？…][\s"\'）\)]*$')
-
     groups = []
     current_group = []
 
@@ -385,7 +388,7 @@ def _group_segments_by_sentence(segments: List[Segment], max_group_size: int = 1
         text = seg.text.strip()
 
         # Check if this segment ends a sentence OR group is too large
-        if sentence_end.search(text) or not text or len(current_group) >= max_group_size:
+        if _SENTENCE_END_RE.search(text) or not text or len(current_group) >= max_group_size:
             if current_group:
                 groups.append(current_group)
                 current_group = []
@@ -590,7 +593,7 @@ def _translate_with_word_alignment(
             end_part = parts[1].lower()
 
             # Extract end position
-            match = re.search(r'end:\s*(\d+)', end_part)
+            match = _END_INDEX_RE.search(end_part)
             if match:
                 end_idx = int(match.group(1))
 
@@ -1529,7 +1532,7 @@ def proofread_translations(
                 for line in correction_lines:
                     line = line.strip()
                     # Remove patterns like "1. ", "1) ", etc.
-                    line = re.sub(r'^\d+[\.\)]\s*', '', line)
+                    line = _LINE_NUMBERING_RE.sub('', line)
                     if line:
                         cleaned.append(line)
                 correction_lines = cleaned
@@ -1,12 +1,26 @@
 """Audio module unit tests"""
 
+import wave
 from unittest.mock import patch
-from src.audio import check_ffmpeg, check_ffprobe
+
+import pytest
+
+from src import audio
+from src.audio import (
+    check_ffmpeg,
+    check_ffprobe,
+    cleanup_temp_files,
+    extract_audio,
+    get_audio_duration,
+)
 
 
 class TestFFmpegCheck:
     """FFmpeg/FFprobe check tests"""
 
+    def setup_method(self):
+        audio._found_tools.clear()
+
     @patch('shutil.which')
     def test_ffmpeg_found(self, mock_which):
         mock_which.return_value = '/usr/bin/ffmpeg'
@@ -28,3 +42,91 @@ class TestFFmpegCheck:
     def test_ffprobe_not_found(self, mock_which):
         mock_which.return_value = None
         assert check_ffprobe() is False
+
+    @patch('shutil.which')
+    def test_found_tool_is_remembered(self, mock_which):
+        mock_which.return_value = '/usr/bin/ffmpeg'
+        assert check_ffmpeg() is True
+        assert check_ffmpeg() is True
+        mock_which.assert_called_once_with('ffmpeg')
+
+    @patch('shutil.which')
+    def test_missing_tool_is_rechecked(self, mock_which):
+        mock_which.side_effect = [None, '/usr/bin/ffmpeg']
+        assert check_ffmpeg() is False
+        assert check_ffmpeg() is True
+        assert mock_which.call_count == 2
+
+
+class TestExtractAudio:
+    """extract_audio tests"""
+
+    @patch('shutil.which')
+    def test_failure_reports_decoded_stderr(self, mock_which, tmp_path):
+        mock_which.return_value = '/usr/bin/ffmpeg'
+        video = tmp_path / "ep01.mkv"
+        video.write_bytes(b"")
+        config = {'advanced': {'temp_dir': str(tmp_path / "tmp")}}
+
+        with patch('src.audio.subprocess.run') as mock_run:
+            mock_run.return_value.returncode = 1
+            mock_run.return_value.stderr = "Invalid data found — ép01".encode()
+            with pytest.raises(RuntimeError, match="Invalid data found — ép01"):
+                extract_audio(video, config)
+        assert mock_run.call_args[1]['stdout'] is audio.subprocess.DEVNULL
+
+
+class TestAudioDuration:
+    """get_audio_duration tests"""
+
+    def test_wav_read_from_header(self, tmp_path):
+        wav_path = tmp_path / "clip_audio.wav"
+        with wave.open(str(wav_path), 'wb') as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(16000)
+            wav.writeframes(b"\x00\x00" * 24000)
+
+        with patch('src.audio.subprocess.run') as mock_run:
+            assert get_audio_duration(wav_path) == pytest.approx(1.5)
+        mock_run.assert_not_called()
+
+    @patch('shutil.which')
+    def test_non_wav_falls_back_to_ffprobe(self, mock_which, tmp_path):
+        mock_which.return_value = '/usr/bin/ffprobe'
+        audio_path = tmp_path / "clip.mp3"
+        audio_path.write_bytes(b"ID3not-a-wav")
+
+        with patch('src.audio.subprocess.run') as mock_run:
+            mock_run.return_value.returncode = 0
+            mock_run.return_value.stdout = b"12.5\n"
+            assert get_audio_duration(audio_path) == pytest.approx(12.5)
+        assert mock_run.call_args[0][0][0] == 'ffprobe'
+
+    @patch('shutil.which')
+    def test_missing_file(self, mock_which, tmp_path):
+        mock_which.return_value = '/usr/bin/ffprobe'
+        with pytest.raises(FileNotFoundError):
+            get_audio_duration(tmp_path / "missing.wav")
+
+
+class TestCleanupTempFiles:
+    """cleanup_temp_files tests"""
+
+    def test_removes_only_extracted_audio(self, tmp_path):
+        (tmp_path / "ep01_audio.wav").write_bytes(b"")
+        (tmp_path / "ep02_audio.wav").write_bytes(b"")
+        (tmp_path / "notes.txt").write_text("keep")
+        (tmp_path / "dir_audio.wav").mkdir()
+
+        cleanup_temp_files({'advanced': {'temp_dir': str(tmp_path)}})
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["dir_audio.wav", "notes.txt"]
+
+    def test_keep_temp_files(self, tmp_path):
+        (tmp_path / "ep01_audio.wav").write_bytes(b"")
+        cleanup_temp_files({'advanced': {'temp_dir': str(tmp_path), 'keep_temp_files': True}})
+        assert (tmp_path / "ep01_audio.wav").exists()
+
+    def test_missing_temp_dir(self, tmp_path):
+        cleanup_temp_files({'advanced': {'temp_dir': str(tmp_path / "missing")}})